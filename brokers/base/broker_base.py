@@ -21,7 +21,7 @@ class BrokerBase(BrokerInterface, ABC):
         self.name = name
         self._connected = False
         
-        logger.debug(f"Initializing {name} broker")
+        logger.debug("Initializing %s broker", name)
     
     def is_connected(self) -> bool:
         """
@@ -50,7 +50,7 @@ class BrokerBase(BrokerInterface, ABC):
             operation: Operation name
             **kwargs: Operation parameters
         """
-        logger.debug(f"[{self.name}] {operation}: {kwargs}")
+        logger.debug("[%s] %s: %s", self.name, operation, kwargs)
     
     def _log_error(self, operation: str, error: Exception):
         """
@@ -1,5 +1,6 @@
 """Dummy Broker - simulates a trading broker for testing."""
 import random
+import threading
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
@@ -22,6 +23,8 @@ class DummyBroker(BrokerInterface):
         self._symbols: Dict[str, Symbol] = {}
         self._open_orders: List[Order] = []
         self._closed_orders: List[Order] = []
+        # Orders are placed from OrderDispatcher's thread and read from the GUI thread
+        self._orders_lock = threading.Lock()
         self._account_manager: Optional[AccountManager] = None
         self._update_timer: Optional[QTimer] = None
         
@@ -92,6 +95,10 @@ class DummyBroker(BrokerInterface):
         """Get symbol information."""
         return self._symbols.get(symbol)
     
+    def get_symbol_infos(self, symbols) -> Dict[str, Symbol]:
+        """Get symbol information for several symbols in one lookup pass."""
+        return {s: self._symbols[s] for s in symbols if s in self._symbols}
+    
     def subscribe(self, symbol: str):
         """Subscribe to symbol updates."""
         feed_manager.subscribe(symbol)
@@ -157,7 +164,8 @@ class DummyBroker(BrokerInterface):
             comment=comment
         )
         
-        self._open_orders.append(order)
+        with self._orders_lock:
+            self._open_orders.append(order)
         event_bus.order_placed.emit(order)
         logger.info(f"Order placed: {order.ticket} {order_type.value} {volume} {symbol} @ {exec_price}")
         
@@ -165,21 +173,25 @@ class DummyBroker(BrokerInterface):
     
     def modify_order(self, ticket: int, sl: float = 0.0, tp: float = 0.0) -> bool:
         """Modify order SL/TP."""
-        for order in self._open_orders:
-            if order.ticket == ticket:
+        with self._orders_lock:
+            order = next((o for o in self._open_orders if o.ticket == ticket), None)
+            if order:
                 order.sl = sl
                 order.tp = tp
-                event_bus.order_modified.emit(order)
-                logger.info(f"Order modified: {ticket} SL={sl} TP={tp}")
-                return True
+                
+        if order:
+            event_bus.order_modified.emit(order)
+            logger.info(f"Order modified: {ticket} SL={sl} TP={tp}")
+            return True
         
         logger.error(f"Order {ticket} not found")
         return False
     
     def close_order(self, ticket: int) -> bool:
         """Close an order."""
-        for order in self._open_orders:
-            if order.ticket == ticket:
+        with self._orders_lock:
+            order = next((o for o in self._open_orders if o.ticket == ticket), None)
+            if order:
                 symbol_info = self._symbols.get(order.symbol)
                 if not symbol_info:
                     return False
@@ -197,20 +209,23 @@ class DummyBroker(BrokerInterface):
                 self._open_orders.remove(order)
                 self._closed_orders.append(order)
                 
-                event_bus.order_closed.emit(order)
-                logger.info(f"Order closed: {ticket} @ {close_price}")
-                return True
+        if order:
+            event_bus.order_closed.emit(order)
+            logger.info(f"Order closed: {ticket} @ {close_price}")
+            return True
         
         logger.error(f"Order {ticket} not found")
         return False
     
     def get_open_orders(self) -> List[Order]:
         """Get all open orders."""
-        return self._open_orders.copy()
+        with self._orders_lock:
+            return self._open_orders.copy()
     
     def get_order_history(self) -> List[Order]:
         """Get closed orders."""
-        return self._closed_orders.copy()
+        with self._orders_lock:
+            return self._closed_orders.copy()
     
     def get_account_info(self) -> dict:
         """Get account information."""
@@ -260,7 +275,7 @@ class DummyBroker(BrokerInterface):
     
     def _check_sl_tp(self):
         """Check if any orders hit SL or TP."""
-        for order in self._open_orders.copy():
+        for order in self.get_open_orders():
             symbol_info = self._symbols.get(order.symbol)
             if not symbol_info:
                 continue
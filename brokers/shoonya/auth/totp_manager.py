@@ -33,7 +33,7 @@ class TOTPManager:
         try:
             totp = pyotp.TOTP(self.totp_key)
             code = totp.now()
-            logger.debug(f"Generated TOTP code: {code}")
+            logger.debug("Generated TOTP code: %s", code)
             return code
         except Exception as e:
             logger.error(f"Failed to generate TOTP: {e}")
@@ -48,7 +48,7 @@ class ShoonyaMarketDataManager:
                     if item.get('tsym') == symbol:
                         token = item.get('token')
                         self.token_cache[cache_key] = token
-                        logger.debug(f"Found token {token} for {symbol} (Exact match)")
+                        logger.debug("Found token %s for %s (Exact match)", token, symbol)
                         return token
                 
                 # 2. Try match with -EQ suffix (common for NSE)
@@ -57,7 +57,7 @@ class ShoonyaMarketDataManager:
                     if item.get('tsym') == symbol_eq:
                         token = item.get('token')
                         self.token_cache[cache_key] = token
-                        logger.debug(f"Found token {token} for {symbol} (Suffix match)")
+                        logger.debug("Found token %s for %s (Suffix match)", token, symbol)
                         return token
 
                 # 3. Try match where result starts with symbol (e.g. RELIANCE vs RELIANCE-EQ)
@@ -66,7 +66,7 @@ class ShoonyaMarketDataManager:
                     if tsym.startswith(symbol) and (tsym == symbol or tsym == f"{symbol}-EQ"):
                          token = item.get('token')
                          self.token_cache[cache_key] = token
-                         logger.debug(f"Found token {token} for {symbol} (Prefix match)")
+                         logger.debug("Found token %s for %s (Prefix match)", token, symbol)
                          return token
                 
                 # 4. If still no match but we have results, take the first one if it looks reasonable
@@ -135,7 +135,7 @@ class ShoonyaMarketDataManager:
                 ask = float(result.get('sp1', 0))
                 ltp = float(result.get('lp', 0))
                 
-                logger.debug(f"Quote for {symbol}: LTP={ltp}, Bid={bid}, Ask={ask}")
+                logger.debug("Quote for %s: LTP=%s, Bid=%s, Ask=%s", symbol, ltp, bid, ask)
                 
                 return Symbol(
                     name=symbol,
@@ -2,6 +2,7 @@
 Shoonya Order Manager
 Handles order placement, modification, and cancellation
 """
+import threading
 from typing import Optional, List
 from datetime import datetime
 from data.models import Order, OrderType, OrderStatus
@@ -16,6 +17,9 @@ class ShoonyaOrderManager:
         self.auth_manager = auth_manager
         self.open_orders: List[Order] = []
         self.closed_orders: List[Order] = []
+        # Guards open_orders, which is replaced rather than mutated so lists
+        # already handed to callers never change under them
+        self._orders_lock = threading.Lock()
     
     def place_order(
         self,
@@ -101,7 +105,8 @@ class ShoonyaOrderManager:
                     comment=kwargs.get('comment', '')
                 )
                 
-                self.open_orders.append(order)
+                with self._orders_lock:
+                    self.open_orders = self.open_orders + [order]
                 logger.info(f"Order placed: {order_no}")
                 return order
             else:
@@ -124,7 +129,8 @@ class ShoonyaOrderManager:
             
             if result and result.get('stat') == 'Ok':
                 # Remove from open orders
-                self.open_orders = [o for o in self.open_orders if o.ticket != ticket]
+                with self._orders_lock:
+                    self.open_orders = [o for o in self.open_orders if o.ticket != ticket]
                 logger.info(f"Order {ticket} cancelled")
                 return True
             else:
@@ -262,8 +268,10 @@ class ShoonyaOrderManager:
     def get_open_orders(self) -> List[Order]:
         """Get all open orders."""
         all_orders = self.get_order_book()
-        self.open_orders = [o for o in all_orders if o.status in [OrderStatus.ACTIVE, OrderStatus.PENDING]]
-        return self.open_orders
+        open_orders = [o for o in all_orders if o.status in [OrderStatus.ACTIVE, OrderStatus.PENDING]]
+        with self._orders_lock:
+            self.open_orders = open_orders
+        return open_orders
     
     def get_order_history(self) -> List[Order]:
         """Get order history."""
@@ -2,6 +2,7 @@
 Shoonya WebSocket Client
 Handles real-time market data and order updates via WebSocket.
 """
+import logging
 import threading
 import time
 from typing import List, Dict, Callable, Optional
@@ -128,7 +129,7 @@ class ShoonyaWebSocketClient:
         """
         try:
             msg_type = tick_data.get('t')
-            logger.debug(f"WS Message: {tick_data}")
+            logger.debug("WS Message: %s", tick_data)
             if msg_type not in ['tk', 'tf']:
                 return
 
@@ -172,7 +173,8 @@ class ShoonyaWebSocketClient:
                 symbol_name = self.token_map[token]
             else:
                 # Fallback: try to construct it or ignore
-                logger.debug(f"Unknown token {token} in tick. Map keys: {list(self.token_map.keys())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Unknown token %s in tick. Map keys: %s", token, list(self.token_map.keys()))
                 return
 
             # Parse fields
@@ -1,9 +1,15 @@
 """Abstract Broker Interface - defines the contract for broker connectors."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
 from data.models import Symbol, Order, OHLCData, OrderType
 from datetime import datetime
 
+# Per-symbol quote requests issued concurrently by the default get_symbol_infos()
+QUOTE_FANOUT_WORKERS = 8
+
+_io_pool = ThreadPoolExecutor(max_workers=QUOTE_FANOUT_WORKERS, thread_name_prefix="quote-io")
+
 
 class BrokerInterface(ABC):
     """Abstract base class for broker connections."""
@@ -43,6 +49,24 @@ class BrokerInterface(ABC):
         """Get current symbol information (bid, ask, etc.)."""
         pass
     
+    def get_symbol_infos(self, symbols: Iterable[str]) -> Dict[str, Symbol]:
+        """
+        Get current symbol information for several symbols at once.
+        
+        The default implementation calls get_symbol_info() per symbol,
+        fanned out over a shared thread pool so the round trips overlap;
+        brokers with a batch quote API should override it.
+        
+        Returns:
+            Dict of symbol -> Symbol (unknown symbols are omitted)
+        """
+        symbols = list(symbols)
+        if len(symbols) > 1:
+            infos = _io_pool.map(self.get_symbol_info, symbols)
+        else:
+            infos = map(self.get_symbol_info, symbols)
+        return {symbol: info for symbol, info in zip(symbols, infos) if info is not None}
+    
     @abstractmethod
     def subscribe(self, symbol: str):
         """Subscribe to real-time price updates for a symbol."""
@@ -89,6 +113,9 @@ class BrokerInterface(ABC):
         """
         Place a new order.
         
+        Called from OrderDispatcher's thread, so implementations must guard
+        any order state that other threads read.
+        
         Args:
             symbol: Trading symbol
             order_type: Type of order (BUY, SELL, etc.)
@@ -68,7 +68,7 @@ class CandleBuilder(QObject):
                     if tf in self.current_candles[symbol_name]:
                         closed_candle = self.current_candles[symbol_name][tf]
                         self._emit_candle_close(symbol_name, closed_candle)
-                        logger.debug(f"Candle closed: {symbol_name} {tf} at {closed_candle.timestamp}")
+                        logger.debug("Candle closed: %s %s at %s", symbol_name, tf, closed_candle.timestamp)
             
             # Update or create current candle
             if tf not in self.current_candles[symbol_name] or candle_time > self.last_candle_time[symbol_name].get(tf, datetime.min):
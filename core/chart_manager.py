@@ -1,3 +1,4 @@
+import logging
 import os
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox
@@ -125,9 +126,6 @@ class ChartManager:
             end_time = datetime.now()
             start_time = end_time - timedelta(days=7)
             
-            # Clean up finished workers
-            self.active_workers = [w for w in self.active_workers if w.isRunning()]
-            
             worker = HistoricalDataWorker(
                 self.broker, 
                 symbol_name, 
@@ -139,17 +137,18 @@ class ChartManager:
             # Connect signal to update specific chart
             if symbol_name in self.charts:
                 chart_widget = self.charts[symbol_name]
-                worker.data_received.connect(chart_widget.update_chart)
+                worker.signals.data_received.connect(chart_widget.update_chart)
             
-            worker.data_received.connect(
+            worker.signals.data_received.connect(
                 lambda data: logger.info(f"Received {len(data)} candles for {symbol_name}")
             )
-            worker.error_occurred.connect(
+            worker.signals.error_occurred.connect(
                 lambda err: logger.error(f"Chart data error for {symbol_name}: {err}")
             )
             
-            # Store worker reference
+            # Store worker reference until it has finished
             self.active_workers.append(worker)
+            worker.signals.finished.connect(lambda: self.active_workers.remove(worker))
             worker.start()
             logger.info(f"Worker started for {symbol_name}")
             
@@ -206,5 +205,6 @@ class ChartManager:
             # logger.info(f"Updating chart for {symbol.name} with price {symbol.last}")
             self.charts[symbol.name].update_tick(symbol)
         else:
-            logger.debug(f"No chart found for {symbol.name}. Active charts: {list(self.charts.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("No chart found for %s. Active charts: %s", symbol.name, list(self.charts.keys()))
             pass
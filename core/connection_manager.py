@@ -1,10 +1,13 @@
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt, QTimer
 from utils.logger import logger
 from utils.worker_threads import BrokerConnectionWorker
 from core.event_bus import event_bus
 from core.ea_manager import ea_manager
 from core.position_tracker import position_tracker
 
+# Status bar shows at most one progress message per frame
+PROGRESS_FRAME_MS = 50
+
 class ConnectionManager:
     """
     Manages broker connection and related events.
@@ -14,6 +17,13 @@ class ConnectionManager:
         self.broker = broker
         self.connection_worker = None
         self.time_timer = None
+        
+        # Latest progress message waiting for the next status bar frame
+        self._pending_progress = None
+        self._progress_timer = QTimer(main_window)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FRAME_MS)
+        self._progress_timer.timeout.connect(self._apply_progress)
 
     def connect_broker(self):
         """Connect to broker asynchronously."""
@@ -54,9 +64,11 @@ class ConnectionManager:
             )
             
             # Connect worker signals
-            self.connection_worker.progress_update.connect(self._on_connection_progress)
-            self.connection_worker.connection_success.connect(self._on_connection_success)
-            self.connection_worker.connection_failed.connect(self._on_connection_failed)
+            self.connection_worker.signals.progress_update.connect(
+                self._on_connection_progress, Qt.QueuedConnection
+            )
+            self.connection_worker.signals.connection_success.connect(self._on_connection_success)
+            self.connection_worker.signals.connection_failed.connect(self._on_connection_failed)
             
             # Start connection in background
             self.connection_worker.start()
@@ -67,14 +79,27 @@ class ConnectionManager:
             logger.error(traceback.format_exc())
 
     def _on_connection_progress(self, message):
-        """Handle connection progress updates."""
+        """Handle connection progress updates (status bar shows the latest per frame)."""
         logger.info(message)
-        if self.main_window.ui.status_bar:
+        self._pending_progress = message
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+            
+    def _apply_progress(self):
+        """Show the most recent progress message."""
+        message, self._pending_progress = self._pending_progress, None
+        if message is not None and self.main_window.ui.status_bar:
             self.main_window.ui.status_bar.showMessage(message)
+            
+    def _discard_progress(self):
+        """Drop a queued progress message so it cannot replace the final status."""
+        self._progress_timer.stop()
+        self._pending_progress = None
 
     def _on_connection_success(self, username):
         """Handle successful connection."""
         logger.info("Connected to broker")
+        self._discard_progress()
         if self.main_window.ui.status_bar:
             self.main_window.ui.status_bar.showMessage(f"Connected as {username}", 5000)
         if self.main_window.ui.connection_label:
@@ -102,6 +127,7 @@ class ConnectionManager:
     def _on_connection_failed(self, error):
         """Handle connection failure."""
         logger.error(f"Failed to connect to broker: {error}")
+        self._discard_progress()
         if self.main_window.ui.status_bar:
             self.main_window.ui.status_bar.showMessage(f"Connection failed: {error}")
         if self.main_window.ui.connection_label:
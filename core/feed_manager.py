@@ -55,7 +55,7 @@ class FeedManager(QObject):
         
         # Debug: Log symbol formats
         if symbol_data.display_name and symbol_data.display_name != symbol_data.name:
-            logger.debug(f"Symbol formats: {symbol_data.name} <-> {symbol_data.display_name}")
+            logger.debug("Symbol formats: %s <-> %s", symbol_data.name, symbol_data.display_name)
         
         # Auto-register symbol format mapping
         symbol_normalizer.auto_register_from_symbol(symbol_data)
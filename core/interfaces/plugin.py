@@ -3,9 +3,17 @@ Plugin Interface Definitions.
 Defines the base classes for all plugins in the system.
 """
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from typing import Dict, Any, Optional
 import pandas as pd
 
+# Declarative description of a user-editable indicator parameter.
+# kind: "int", "float", "str", "color" or "choice"
+ParamSpec = namedtuple(
+    "ParamSpec", "name kind min max decimals choices",
+    defaults=(None, None, 2, ())
+)
+
 class Plugin(ABC):
     """Base class for all plugins."""
     
@@ -27,8 +35,14 @@ class Plugin(ABC):
 class Indicator(Plugin):
     """
     Base class for Technical Indicators.
+    
+    Subclasses may declare their editable parameters in PARAMS
+    (a tuple of ParamSpec); otherwise they are introspected from
+    the instance attributes.
     """
     
+    PARAMS = None
+    
     def __init__(self):
         super().__init__()
         self.type = "Indicator"
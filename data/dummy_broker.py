@@ -92,6 +92,10 @@ class DummyBroker(BrokerInterface):
         """Get symbol information."""
         return self._symbols.get(symbol)
     
+    def get_symbol_infos(self, symbols) -> Dict[str, Symbol]:
+        """Get symbol information for several symbols in one lookup pass."""
+        return {s: self._symbols[s] for s in symbols if s in self._symbols}
+    
     def subscribe(self, symbol: str):
         """Subscribe to symbol updates."""
         feed_manager.subscribe(symbol)
@@ -1,8 +1,9 @@
 """Data models for the trading application."""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 from enum import Enum
+import numpy as np
 
 
 class OrderType(Enum):
@@ -43,6 +44,25 @@ class OHLCData:
             self.low = min(self.open, self.close, self.high)
 
 
+# Column-wise (structured array) layout for bulk OHLC data
+OHLC_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[s]'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8'),
+])
+
+
+def ohlc_to_array(candles: Iterable[OHLCData]) -> np.ndarray:
+    """Pack OHLCData objects into an OHLC_DTYPE structured array."""
+    return np.array(
+        [(c.timestamp, c.open, c.high, c.low, c.close, c.volume) for c in candles],
+        dtype=OHLC_DTYPE
+    )
+
+
 @dataclass
 class Symbol:
     """Trading symbol information."""
@@ -207,6 +227,17 @@ class EAState:
     started_time: Optional[datetime] = None
     last_update: datetime = field(default_factory=datetime.now)
     
+    # Memoized display strings, invalidated in __setattr__
+    _total_profit_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _win_rate_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in ('profit', 'floating_profit'):
+            object.__setattr__(self, '_total_profit_str', None)
+        elif name in ('total_trades', 'winning_trades'):
+            object.__setattr__(self, '_win_rate_str', None)
+    
     @property
     def win_rate(self) -> float:
         """Calculate win rate percentage."""
@@ -218,6 +249,20 @@ class EAState:
     def total_profit(self) -> float:
         """Calculate total profit (realized + unrealized)."""
         return self.profit + self.floating_profit
+    
+    @property
+    def total_profit_str(self) -> str:
+        """Total profit formatted for display (e.g. "$12.50")."""
+        if self._total_profit_str is None:
+            self._total_profit_str = f"${self.total_profit:.2f}"
+        return self._total_profit_str
+    
+    @property
+    def win_rate_str(self) -> str:
+        """Win rate formatted for display (e.g. "55.0%")."""
+        if self._win_rate_str is None:
+            self._win_rate_str = f"{self.win_rate:.1f}%"
+        return self._win_rate_str
 
 
 @dataclass
@@ -10,6 +10,7 @@ from PyQt5.QtCore import pyqtSlot
 # Import our modules
 from utils.config_manager import config
 from utils.logger import logger
+from utils.worker_threads import OrderDispatcher, OrderRequest
 from core.event_bus import event_bus
 from brokers.factory import broker_factory
 from brokers.registry import register_builtin_brokers
@@ -59,6 +60,11 @@ class MainWindow(QMainWindow):
         self.chart_manager = ChartManager(self, self.broker)
         self.connection_manager = ConnectionManager(self, self.broker)
         
+        # Manual orders are sent one at a time off the GUI thread
+        self.order_dispatcher = OrderDispatcher(self.broker)
+        self.order_dispatcher.order_placed.connect(self._on_dispatched_order_placed)
+        self.order_dispatcher.order_failed.connect(self._on_dispatched_order_failed)
+        
         # Initialize UI
         self.ui.init_ui(self.broker)
         
@@ -279,17 +285,28 @@ class MainWindow(QMainWindow):
         order_type = OrderType.BUY if order_type_str == "BUY" else OrderType.SELL
         volume = 0.1
         
-        order = self.broker.place_order(
+        self.order_dispatcher.submit(OrderRequest(
+            source="one-click",
             symbol=symbol,
             order_type=order_type,
             volume=volume,
             comment="One-click trading"
-        )
+        ))
         
-        if order:
+    def _on_dispatched_order_placed(self, request, order):
+        """Handle an order placed by the dispatcher."""
+        if request.source == "one-click":
             logger.info(f"Market order placed: {order.ticket}")
         else:
+            self.ui.status_bar.showMessage(f"Order placed for {request.kwargs['symbol']}", 5000)
+            
+    def _on_dispatched_order_failed(self, request, error):
+        """Handle an order the dispatcher could not place."""
+        if request.source == "one-click":
             logger.error("Failed to place order")
+        else:
+            logger.error(f"Error placing order: {error}")
+            QMessageBox.critical(self, "Order Error", f"Failed to place order: {error}")
     
     def _show_new_order_dialog(self):
         """Show the new order dialog."""
@@ -330,16 +347,15 @@ class MainWindow(QMainWindow):
                 elif o_type == "LIMIT": final_order_type = OrderType.SELL_LIMIT
                 elif o_type in ["SL-L", "SL-M"]: final_order_type = OrderType.SELL_STOP
             
-            self.broker.place_order(
+            self.order_dispatcher.submit(OrderRequest(
+                source="dialog",
                 symbol=order_data['symbol'],
                 order_type=final_order_type,
                 volume=order_data['quantity'],
                 price=order_data['price'],
                 trigger_price=order_data['trigger_price'],
                 product_type=order_data['product_type']
-            )
-            
-            self.ui.status_bar.showMessage(f"Order placed for {order_data['symbol']}", 5000)
+            ))
             
         except Exception as e:
             logger.error(f"Error placing order: {e}")
@@ -503,6 +519,8 @@ class MainWindow(QMainWindow):
         """Handle application close."""
         logger.info("Application closing...")
         ea_manager.stop_all()
+        self.order_dispatcher.stop()
+        self.order_dispatcher.wait(2000)
         self.connection_manager.disconnect()
         event.accept()
 
@@ -3,7 +3,7 @@ Bollinger Bands Indicator.
 Calculates Bollinger Bands (Upper, Middle, Lower).
 """
 import pandas as pd
-from core.interfaces.plugin import Indicator
+from core.interfaces.plugin import Indicator, ParamSpec
 from PyQt5.QtGui import QColor
 import pyqtgraph as pg
 import numpy as np
@@ -13,6 +13,13 @@ class BollingerBands(Indicator):
     Bollinger Bands Indicator.
     """
     
+    PARAMS = (
+        ParamSpec("period", "int", 1, 1000),
+        ParamSpec("std_dev", "float", 0.1, 10.0, 2),
+        ParamSpec("color", "color"),
+        ParamSpec("width", "int", 1, 10),
+    )
+    
     def __init__(self):
         super().__init__()
         self.name = "Bollinger Bands"
@@ -3,7 +3,7 @@ Moving Average Indicator.
 Calculates Simple Moving Average (SMA) or Exponential Moving Average (EMA).
 """
 import pandas as pd
-from core.interfaces.plugin import Indicator
+from core.interfaces.plugin import Indicator, ParamSpec
 from PyQt5.QtGui import QColor
 import pyqtgraph as pg
 import numpy as np
@@ -14,6 +14,13 @@ class MovingAverage(Indicator):
     Supports SMA and EMA.
     """
     
+    PARAMS = (
+        ParamSpec("period", "int", 1, 1000),
+        ParamSpec("ma_type", "choice", choices=("SMA", "EMA")),
+        ParamSpec("color", "color"),
+        ParamSpec("width", "int", 1, 10),
+    )
+    
     def __init__(self):
         super().__init__()
         self.name = "Moving Average"
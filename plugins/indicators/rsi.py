@@ -3,7 +3,7 @@ RSI Indicator.
 Calculates Relative Strength Index.
 """
 import pandas as pd
-from core.interfaces.plugin import Indicator
+from core.interfaces.plugin import Indicator, ParamSpec
 from PyQt5.QtGui import QColor
 import pyqtgraph as pg
 import numpy as np
@@ -13,6 +13,14 @@ class RSI(Indicator):
     Relative Strength Index (RSI) Indicator.
     """
     
+    PARAMS = (
+        ParamSpec("period", "int", 1, 1000),
+        ParamSpec("color", "color"),
+        ParamSpec("width", "int", 1, 10),
+        ParamSpec("upper_level", "int", 1, 100),
+        ParamSpec("lower_level", "int", 1, 100),
+    )
+    
     def __init__(self):
         super().__init__()
         self.name = "RSI"
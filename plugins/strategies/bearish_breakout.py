@@ -170,7 +170,7 @@ class BearishBreakoutEA(ExpertAdvisor):
             
             # Avoid duplicate signals (one per candle)
             if self.last_signal_time and self.last_signal_time >= candle_0.timestamp:
-                logger.debug(f"{self.name}: Signal already generated for this candle")
+                logger.debug("%s: Signal already generated for this candle", self.name)
                 return
             
             # Generate sell signal
@@ -169,7 +169,7 @@ class BullishBreakoutEA(ExpertAdvisor):
             
             # Avoid duplicate signals (one per candle)
             if self.last_signal_time and self.last_signal_time >= candle_0.timestamp:
-                logger.debug(f"{self.name}: Signal already generated for this candle")
+                logger.debug("%s: Signal already generated for this candle", self.name)
                 return
             
             # Generate buy signal
@@ -103,7 +103,7 @@ class MACrossoverEA(ExpertAdvisor):
         slow_period = self.config.parameters.get('slow_period', 20)
         
         if len(self.candles_buffer) < slow_period + 1:
-            logger.debug(f"{self.name}: Waiting for more candles ({len(self.candles_buffer)}/{slow_period + 1})")
+            logger.debug("%s: Waiting for more candles (%s/%s)", self.name, len(self.candles_buffer), slow_period + 1)
             return
             
         # Calculate MAs
@@ -8,6 +8,7 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QColor, QPainter, QPicture
 import numpy as np
 from datetime import datetime, timedelta
+from data.models import OHLC_DTYPE, ohlc_to_array
 
 class CandlestickItem(pg.GraphicsObject):
     """Custom GraphicsObject for drawing candlesticks."""
@@ -140,21 +141,20 @@ class ChartWidget(QWidget):
         
         # Placeholder for data
         self.candle_item = None
-        self.data = [] # List of OHLCData
+        self.data = np.empty(0, dtype=OHLC_DTYPE)  # OHLC_DTYPE structured array
         
     def get_data(self):
         """
         Get current chart data as DataFrame.
         Returns: pd.DataFrame or None
         """
-        if not self.data:
+        if not len(self.data):
             return None
             
         import pandas as pd
         
-        # Convert OHLCData objects to dicts
-        data_list = [c.__dict__ for c in self.data]
-        df = pd.DataFrame(data_list)
+        # Structured array columns map straight onto DataFrame columns
+        df = pd.DataFrame(self.data)
         
         # Ensure timestamp is datetime and set as index
         if 'timestamp' in df.columns:
@@ -166,11 +166,13 @@ class ChartWidget(QWidget):
     def update_chart(self, ohlc_data):
         """
         Update chart with new OHLC data.
-        ohlc_data: List of OHLCData objects
+        ohlc_data: OHLC_DTYPE structured array (or a list of OHLCData objects)
         """
+        if not isinstance(ohlc_data, np.ndarray):
+            ohlc_data = ohlc_to_array(ohlc_data)
         self.data = ohlc_data
         
-        if not ohlc_data:
+        if not len(ohlc_data):
             return
             
         self.plot_item.clear()
@@ -182,21 +184,17 @@ class ChartWidget(QWidget):
         # Prepare data for CandlestickItem
         # Format: (time_index, open, close, low, high)
         # We use index for X-axis to avoid gaps for weekends/holidays
-        chart_data = []
-        timestamps = []
-        
-        for i, candle in enumerate(ohlc_data):
-            chart_data.append((
-                i, 
-                candle.open, 
-                candle.close, 
-                candle.low, 
-                candle.high
-            ))
-            timestamps.append(candle.timestamp)
-            
+        # Columns are converted in bulk; no per-candle attribute access
+        chart_data = list(zip(
+            range(len(ohlc_data)),
+            ohlc_data['open'].tolist(),
+            ohlc_data['close'].tolist(),
+            ohlc_data['low'].tolist(),
+            ohlc_data['high'].tolist()
+        ))
+        
         # Update axis timestamps
-        self.date_axis.set_timestamps(timestamps)
+        self.date_axis.set_timestamps(ohlc_data['timestamp'].tolist())
             
         # Create and add item
         self.candle_item = CandlestickItem(chart_data)
@@ -219,26 +217,20 @@ class ChartWidget(QWidget):
         if price <= 0:
             return
 
-        if not self.data:
+        if not len(self.data):
             # Initialize with first candle if no data exists
-            from data.models import OHLCData
             current_time = datetime.now()
             
             # Create first candle
-            new_candle = OHLCData(
-                timestamp=current_time,
-                open=price,
-                high=price,
-                low=price,
-                close=price,
-                volume=0
+            new_candle = np.array(
+                [(current_time, price, price, price, price, 0.0)], dtype=OHLC_DTYPE
             )
-            self.data = [new_candle]
             
             # Initialize plot
-            self.update_chart(self.data)
+            self.update_chart(new_candle)
             return
         
+        # Record view into self.data; field writes update the array
         last_candle = self.data[-1]
         
         # Check if we need a new candle
@@ -278,19 +270,12 @@ class ChartWidget(QWidget):
 
             current_candle_time = floor_time(current_time, delta)
             
-            if current_candle_time > last_candle.timestamp:
+            if current_candle_time > last_candle['timestamp'].item():
                 # Create new candle
-                from data.models import OHLCData
-                new_candle = OHLCData(
-                    timestamp=current_candle_time,
-                    open=price,
-                    high=price,
-                    low=price,
-                    close=price,
-                    volume=0
+                new_candle = np.array(
+                    [(current_candle_time, price, price, price, price, 0.0)], dtype=OHLC_DTYPE
                 )
-                self.data.append(new_candle)
-                last_candle = new_candle
+                self.data = np.concatenate((self.data, new_candle))
                 
                 # Instead of full update_chart, just append to existing data
                 # Get the new candle index
@@ -311,9 +296,9 @@ class ChartWidget(QWidget):
                 return
 
         # Update last candle
-        last_candle.close = price
-        last_candle.high = max(last_candle.high, price)
-        last_candle.low = min(last_candle.low, price)
+        last_candle['close'] = price
+        last_candle['high'] = max(last_candle['high'], price)
+        last_candle['low'] = min(last_candle['low'], price)
         
         # Trigger repaint
         # Ideally we should optimize this to not redraw everything
@@ -331,10 +316,10 @@ class ChartWidget(QWidget):
             if last_idx >= 0:
                 self.candle_item.update_last_candle(
                     last_idx,
-                    last_candle.open,
-                    last_candle.close,
-                    last_candle.low,
-                    last_candle.high
+                    float(last_candle['open']),
+                    float(last_candle['close']),
+                    float(last_candle['low']),
+                    float(last_candle['high'])
                 )
         
         # Check if any alerts should trigger
@@ -522,7 +507,7 @@ class ChartWidget(QWidget):
         from data.models import Alert
         
         # Get current price from last candle
-        current_price = self.data[-1].close if self.data else 0.0
+        current_price = float(self.data[-1]['close']) if len(self.data) else 0.0
         
         dialog = AlertDialog(self.symbol, current_price, self)
         if dialog.exec_() == AlertDialog.Accepted:
@@ -3,17 +3,143 @@ EA Control Panel Widget.
 Displays list of EAs with controls and status monitoring.
 """
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QLabel, QGroupBox, QHeaderView, QMenu, QMessageBox
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
+    QPushButton, QLabel, QGroupBox, QHeaderView, QMenu, QMessageBox,
+    QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import Qt, pyqtSlot, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QPalette
 
 from core.ea_manager import ea_manager
 from data.models import EAState
 from ui.ea_config_dialog import EAConfigDialog
 from utils.logger import logger
 
+# Total-profit label stylesheet keyed by the sign of the profit
+_PROFIT_STYLES = {
+    1: "color: #4CAF50; font-weight: bold;",
+    -1: "color: #f44336; font-weight: bold;",
+    0: "",
+}
+
+# Custom role returning (text, foreground, alignment) in a single data() call
+MULTIPLE_ROLES = Qt.UserRole + 1
+
+_STATUS_COLORS = {
+    "running": QColor("#4CAF50"),
+    "stopped": QColor("#9E9E9E"),
+    "paused": QColor("#FF9800"),
+    "error": QColor("#f44336"),
+}
+_GREEN = QColor("#4CAF50")
+_RED = QColor("#f44336")
+_ALIGN_LEFT = int(Qt.AlignLeft | Qt.AlignVCenter)
+_ALIGN_CENTER = int(Qt.AlignCenter)
+_ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+
+
+class EATableModel(QAbstractTableModel):
+    """
+    Table model for EA states.
+    Each row is rendered once into (text, foreground, alignment) cells,
+    so data() is a plain tuple lookup.
+    """
+    
+    HEADERS = ["EA Name", "Status", "Symbol", "Open Pos", "Trades", "Profit", "Win Rate"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names = []
+        self._cells = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cells)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        cell = self._cells[index.row()][index.column()]
+        
+        if role == MULTIPLE_ROLES:
+            return cell
+        elif role == Qt.DisplayRole:
+            return cell[0]
+        elif role == Qt.ForegroundRole:
+            return cell[1]
+        elif role == Qt.TextAlignmentRole:
+            return cell[2]
+        return None
+        
+    def ea_name(self, row: int):
+        """Get the EA name shown in a row."""
+        if 0 <= row < len(self._names):
+            return self._names[row]
+        return None
+        
+    def set_states(self, states: dict):
+        """Replace the table contents with the given {name: EAState} map."""
+        names = list(states)
+        cells = [self._render_row(name, state) for name, state in states.items()]
+        
+        if names == self._names:
+            # Same EAs in the same order: repaint in place so the
+            # selection and current index survive the refresh
+            self._cells = cells
+            if cells:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(cells) - 1, len(self.HEADERS) - 1),
+                    [Qt.DisplayRole, Qt.ForegroundRole]
+                )
+        else:
+            self.beginResetModel()
+            self._names = names
+            self._cells = cells
+            self.endResetModel()
+            
+    @staticmethod
+    def _render_row(ea_name: str, state: EAState) -> tuple:
+        profit = state.total_profit  # Realized + Unrealized
+        profit_color = _GREEN if profit > 0 else _RED if profit < 0 else None
+        
+        return (
+            (ea_name, None, _ALIGN_LEFT),
+            (state.status.upper(), _STATUS_COLORS.get(state.status), _ALIGN_LEFT),
+            (state.symbol, None, _ALIGN_LEFT),
+            (str(state.open_positions), None, _ALIGN_CENTER),
+            (str(state.total_trades), None, _ALIGN_CENTER),
+            (state.total_profit_str, profit_color, _ALIGN_RIGHT),
+            (state.win_rate_str, None, _ALIGN_CENTER),
+        )
+
+
+class MultiRoleDelegate(QStyledItemDelegate):
+    """
+    Delegate that fetches text, color and alignment with one
+    MULTIPLE_ROLES data() call instead of one call per role.
+    """
+    
+    def initStyleOption(self, option, index):
+        text, color, alignment = index.data(MULTIPLE_ROLES)
+        option.index = index
+        option.text = text
+        option.features |= QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = Qt.Alignment(alignment)
+        if color is not None:
+            option.palette.setColor(QPalette.Text, color)
+
 
 class EAControlPanel(QWidget):
     """
@@ -38,11 +164,16 @@ class EAControlPanel(QWidget):
         layout.addWidget(title)
         
         # EA Table
-        self.ea_table = QTableWidget()
-        self.ea_table.setColumnCount(7)
-        self.ea_table.setHorizontalHeaderLabels([
-            "EA Name", "Status", "Symbol", "Open Pos", "Trades", "Profit", "Win Rate"
-        ])
+        self.ea_model = EATableModel(self)
+        self.ea_table = QTableView()
+        self.ea_table.setModel(self.ea_model)
+        self.ea_table.setItemDelegate(MultiRoleDelegate(self.ea_table))
+        
+        # Uniform row heights: only visible rows are measured and painted
+        v_header = self.ea_table.verticalHeader()
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(22)
+        self.ea_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         
         # Configure table
         header = self.ea_table.horizontalHeader()
@@ -61,33 +192,43 @@ class EAControlPanel(QWidget):
         self.ea_table.setColumnWidth(5, 80)
         self.ea_table.setColumnWidth(6, 70)
         
-        self.ea_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.ea_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.ea_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.ea_table.customContextMenuRequested.connect(self.show_context_menu)
         
+        # Context menu (built once, reused for every right-click)
+        self._ctx_menu = QMenu(self)
+        self._act_start = self._ctx_menu.addAction("Start")
+        self._act_pause = self._ctx_menu.addAction("Pause")
+        self._act_stop = self._ctx_menu.addAction("Stop")
+        self._ctx_menu.addSeparator()
+        self._act_config = self._ctx_menu.addAction("Configure")
+        self._ctx_menu.addSeparator()
+        self._act_remove = self._ctx_menu.addAction("Remove")
+        
         layout.addWidget(self.ea_table)
         
-        # Control buttons
+        # Control buttons (colors come from resources/styles.qss)
         button_layout = QHBoxLayout()
         
         self.btn_start = QPushButton("Start")
-        self.btn_start.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
+        self.btn_start.setObjectName("btnStart")
         self.btn_start.clicked.connect(self.start_selected_ea)
         
         self.btn_stop = QPushButton("Stop")
-        self.btn_stop.setStyleSheet("background-color: #f44336; color: white; font-weight: bold;")
+        self.btn_stop.setObjectName("btnStop")
         self.btn_stop.clicked.connect(self.stop_selected_ea)
         
         self.btn_pause = QPushButton("Pause")
-        self.btn_pause.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
+        self.btn_pause.setObjectName("btnPause")
         self.btn_pause.clicked.connect(self.pause_selected_ea)
         
         self.btn_config = QPushButton("Configure")
-        self.btn_config.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
+        self.btn_config.setObjectName("btnConfig")
         self.btn_config.clicked.connect(self.configure_selected_ea)
         
         self.btn_stop_all = QPushButton("Stop All")
-        self.btn_stop_all.setStyleSheet("background-color: #9E9E9E; color: white; font-weight: bold;")
+        self.btn_stop_all.setObjectName("btnStopAll")
         self.btn_stop_all.clicked.connect(self.stop_all_eas)
         
         button_layout.addWidget(self.btn_start)
@@ -107,6 +248,7 @@ class EAControlPanel(QWidget):
         self.lbl_open_pos = QLabel("Open Positions: 0")
         self.lbl_total_profit = QLabel("Total Profit: $0.00")
         self.lbl_total_trades = QLabel("Total Trades: 0")
+        self._profit_sign = 0
         
         stats_layout.addWidget(self.lbl_running)
         stats_layout.addWidget(self.lbl_open_pos)
@@ -148,73 +290,27 @@ class EAControlPanel(QWidget):
         # Get all EA states
         states = ea_manager.get_all_states()
         
-        # Update table
-        self.ea_table.setRowCount(len(states))
+        # Update table with repaints and sorting suspended so the whole
+        # refresh is coalesced into a single paint
+        table = self.ea_table
+        sorting_was_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            self.ea_model.set_states(states)
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_was_enabled)
         
         total_profit = 0.0
         total_trades = 0
         total_open_pos = 0
         running_count = 0
         
-        for row, (ea_name, state) in enumerate(states.items()):
-            # EA Name
-            name_item = QTableWidgetItem(ea_name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.ea_table.setItem(row, 0, name_item)
-            
-            # Status
-            status_item = QTableWidgetItem(state.status.upper())
-            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-            
-            # Color code status
+        for state in states.values():
             if state.status == "running":
-                status_item.setForeground(QColor("#4CAF50"))
                 running_count += 1
-            elif state.status == "stopped":
-                status_item.setForeground(QColor("#9E9E9E"))
-            elif state.status == "paused":
-                status_item.setForeground(QColor("#FF9800"))
-            elif state.status == "error":
-                status_item.setForeground(QColor("#f44336"))
-                
-            self.ea_table.setItem(row, 1, status_item)
-            
-            # Symbol
-            symbol_item = QTableWidgetItem(state.symbol)
-            symbol_item.setFlags(symbol_item.flags() & ~Qt.ItemIsEditable)
-            self.ea_table.setItem(row, 2, symbol_item)
-            
-            # Open Positions
-            pos_item = QTableWidgetItem(str(state.open_positions))
-            pos_item.setFlags(pos_item.flags() & ~Qt.ItemIsEditable)
-            pos_item.setTextAlignment(Qt.AlignCenter)
-            self.ea_table.setItem(row, 3, pos_item)
-            
-            # Total Trades
-            trades_item = QTableWidgetItem(str(state.total_trades))
-            trades_item.setFlags(trades_item.flags() & ~Qt.ItemIsEditable)
-            trades_item.setTextAlignment(Qt.AlignCenter)
-            self.ea_table.setItem(row, 4, trades_item)
-            
-            # Profit
-            total_profit_value = state.total_profit  # Realized + Unrealized
-            profit_item = QTableWidgetItem(f"${total_profit_value:.2f}")
-            profit_item.setFlags(profit_item.flags() & ~Qt.ItemIsEditable)
-            profit_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            if total_profit_value > 0:
-                profit_item.setForeground(QColor("#4CAF50"))
-            elif total_profit_value < 0:
-                profit_item.setForeground(QColor("#f44336"))
                 
-            self.ea_table.setItem(row, 5, profit_item)
-            
-            # Win Rate
-            wr_item = QTableWidgetItem(f"{state.win_rate:.1f}%")
-            wr_item.setFlags(wr_item.flags() & ~Qt.ItemIsEditable)
-            wr_item.setTextAlignment(Qt.AlignCenter)
-            self.ea_table.setItem(row, 6, wr_item)
-            
             # Accumulate stats
             total_profit += state.total_profit  # Include floating profit
             total_trades += state.total_trades
@@ -228,24 +324,24 @@ class EAControlPanel(QWidget):
         self.lbl_open_pos.setText(f"Open Positions: {total_open_pos}")
         self.lbl_total_profit.setText(f"Total Profit: ${total_profit:.2f}")
         
-        if total_profit > 0:
-            self.lbl_total_profit.setStyleSheet("color: #4CAF50; font-weight: bold;")
-        elif total_profit < 0:
-            self.lbl_total_profit.setStyleSheet("color: #f44336; font-weight: bold;")
-        else:
-            self.lbl_total_profit.setStyleSheet("")
+        # Restyle only when the profit crosses zero; setStyleSheet forces a
+        # full style recomputation for the label
+        profit_sign = (total_profit > 0) - (total_profit < 0)
+        if profit_sign != self._profit_sign:
+            self._profit_sign = profit_sign
+            self.lbl_total_profit.setStyleSheet(_PROFIT_STYLES[profit_sign])
             
         self.lbl_total_trades.setText(f"Total Trades: {total_trades}")
         
     def get_selected_ea_name(self) -> str:
         """Get selected EA name."""
-        selected_rows = self.ea_table.selectedItems()
+        # The current index stays set without a selection, so ask the selection model
+        rows = self.ea_table.selectionModel().selectedRows()
         
-        if not selected_rows:
+        if not rows:
             return None
             
-        row = selected_rows[0].row()
-        return self.ea_table.item(row, 0).text()
+        return self.ea_model.ea_name(rows[0].row())
         
     def start_selected_ea(self):
         """Start selected EA."""
@@ -345,30 +441,20 @@ class EAControlPanel(QWidget):
         
     def show_context_menu(self, position):
         """Show context menu."""
-        menu = QMenu(self)
-        
-        start_action = menu.addAction("Start")
-        pause_action = menu.addAction("Pause")
-        stop_action = menu.addAction("Stop")
-        menu.addSeparator()
-        config_action = menu.addAction("Configure")
-        menu.addSeparator()
-        remove_action = menu.addAction("Remove")
-        
-        action = menu.exec_(self.ea_table.viewport().mapToGlobal(position))
+        action = self._ctx_menu.exec_(self.ea_table.viewport().mapToGlobal(position))
         
         ea_name = self.get_selected_ea_name()
         
         if not ea_name:
             return
             
-        if action == start_action:
+        if action is self._act_start:
             self.start_selected_ea()
-        elif action == pause_action:
+        elif action is self._act_pause:
             self.pause_selected_ea()
-        elif action == stop_action:
+        elif action is self._act_stop:
             self.stop_selected_ea()
-        elif action == config_action:
+        elif action is self._act_config:
             self.configure_selected_ea()
-        elif action == remove_action:
+        elif action is self._act_remove:
             ea_manager.unregister_ea(ea_name)
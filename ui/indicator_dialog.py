@@ -2,13 +2,38 @@
 Indicator Configuration Dialog.
 Allows users to modify indicator parameters before adding them to the chart.
 """
+from typing import Callable, Dict, List, Tuple
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QSpinBox, QDoubleSpinBox, 
     QComboBox, QPushButton, QFormLayout, QColorDialog
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSlot
 from PyQt5.QtGui import QColor
+from core.interfaces.plugin import ParamSpec
+
+# Common attributes to ignore when introspecting indicators without PARAMS
+_IGNORED_ATTRS = ('name', 'version', 'author', 'description', 'enabled', 'type', 'output_column')
+
+# Indicator class -> [(spec, label, builder)], derived once per class
+_FACTORY_CACHE: Dict[type, List[Tuple[ParamSpec, str, Callable]]] = {}
+
+
+def _introspect_params(indicator) -> tuple:
+    """Derive parameter specs from instance attributes (legacy indicators)."""
+    specs = []
+    for attr, value in indicator.__dict__.items():
+        if attr.startswith('_') or attr in _IGNORED_ATTRS:
+            continue
+            
+        if isinstance(value, int):
+            specs.append(ParamSpec(attr, "int", 1, 1000))
+        elif isinstance(value, float):
+            specs.append(ParamSpec(attr, "float", 0.0, 1000.0, 2))
+        elif isinstance(value, str):
+            specs.append(ParamSpec(attr, "color" if value.startswith('#') else "str"))
+    return tuple(specs)
+
 
 class IndicatorDialog(QDialog):
     """Dialog to configure indicator parameters."""
@@ -38,43 +63,82 @@ class IndicatorDialog(QDialog):
         self.layout.addLayout(button_layout)
         
     def _create_inputs(self):
-        """Introspect indicator attributes and create inputs."""
-        # Common attributes to ignore
-        ignored = ['name', 'version', 'author', 'description', 'enabled', 'type', 'output_column']
+        """Create one input per declared indicator parameter."""
+        for spec, label, build in self._editor_factories(self.indicator):
+            build(self, spec, label, getattr(self.indicator, spec.name))
+            
+    @classmethod
+    def _editor_factories(cls, indicator):
+        """Return the cached (spec, label, builder) list for an indicator class."""
+        indicator_cls = type(indicator)
+        factories = _FACTORY_CACHE.get(indicator_cls)
         
-        for attr, value in self.indicator.__dict__.items():
-            if attr.startswith('_') or attr in ignored:
-                continue
+        if factories is None:
+            specs = getattr(indicator_cls, 'PARAMS', None)
+            if specs is None:
+                specs = _introspect_params(indicator)
+                indicator_cls.PARAMS = specs
                 
-            label = attr.replace('_', ' ').title()
+            factories = [
+                (spec, spec.name.replace('_', ' ').title(), cls._BUILDERS[spec.kind])
+                for spec in specs
+            ]
+            _FACTORY_CACHE[indicator_cls] = factories
             
-            if isinstance(value, int):
-                inp = QSpinBox()
-                inp.setRange(1, 1000)
-                inp.setValue(value)
-                self.inputs[attr] = inp
-                self.form_layout.addRow(label, inp)
-                
-            elif isinstance(value, float):
-                inp = QDoubleSpinBox()
-                inp.setRange(0.0, 1000.0)
-                inp.setDecimals(2)
-                inp.setValue(value)
-                self.inputs[attr] = inp
-                self.form_layout.addRow(label, inp)
-                
-            elif isinstance(value, str):
-                if value.startswith('#'): # Color
-                    btn = QPushButton()
-                    btn.setStyleSheet(f"background-color: {value}")
-                    btn.clicked.connect(lambda checked, b=btn, a=attr: self._pick_color(b, a))
-                    self.inputs[attr] = {'value': value, 'btn': btn}
-                    self.form_layout.addRow(label, btn)
-                else:
-                    inp = QLineEdit(value)
-                    self.inputs[attr] = inp
-                    self.form_layout.addRow(label, inp)
-                    
+        return factories
+        
+    def _build_int(self, spec, label, value):
+        inp = QSpinBox()
+        inp.setRange(spec.min if spec.min is not None else 1,
+                     spec.max if spec.max is not None else 1000)
+        inp.setValue(value)
+        self.inputs[spec.name] = inp
+        self.form_layout.addRow(label, inp)
+        
+    def _build_float(self, spec, label, value):
+        inp = QDoubleSpinBox()
+        inp.setRange(spec.min if spec.min is not None else 0.0,
+                     spec.max if spec.max is not None else 1000.0)
+        inp.setDecimals(spec.decimals)
+        inp.setValue(value)
+        self.inputs[spec.name] = inp
+        self.form_layout.addRow(label, inp)
+        
+    def _build_str(self, spec, label, value):
+        inp = QLineEdit(value)
+        self.inputs[spec.name] = inp
+        self.form_layout.addRow(label, inp)
+        
+    def _build_choice(self, spec, label, value):
+        inp = QComboBox()
+        inp.addItems(spec.choices)
+        inp.setCurrentText(value)
+        self.inputs[spec.name] = inp
+        self.form_layout.addRow(label, inp)
+        
+    def _build_color(self, spec, label, value):
+        attr = spec.name
+        btn = QPushButton()
+        btn.setStyleSheet(f"background-color: {value}")
+        btn.setProperty("attr", attr)
+        btn.clicked.connect(self._on_color_clicked)
+        self.inputs[attr] = {'value': value, 'btn': btn}
+        self.form_layout.addRow(label, btn)
+        
+    _BUILDERS = {
+        "int": _build_int,
+        "float": _build_float,
+        "str": _build_str,
+        "choice": _build_choice,
+        "color": _build_color,
+    }
+    
+    @pyqtSlot()
+    def _on_color_clicked(self):
+        """Shared handler for all color buttons."""
+        btn = self.sender()
+        self._pick_color(btn, btn.property("attr"))
+        
     def _pick_color(self, btn, attr):
         """Open color picker."""
         current_color = QColor(self.inputs[attr]['value'])
@@ -92,6 +156,8 @@ class IndicatorDialog(QDialog):
                 setattr(self.indicator, attr, inp.value())
             elif isinstance(inp, QLineEdit):
                 setattr(self.indicator, attr, inp.text())
+            elif isinstance(inp, QComboBox):
+                setattr(self.indicator, attr, inp.currentText())
             elif isinstance(inp, dict): # Color
                 setattr(self.indicator, attr, inp['value'])
                 
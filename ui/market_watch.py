@@ -1,20 +1,253 @@
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (
     # Market Watch Widget
-    QDockWidget, QTabWidget, QTableWidget, QTableWidgetItem, 
+    QDockWidget, QTabWidget, QTableView, QAbstractItemView,
     QLabel, QWidget, QVBoxLayout, QCompleter, QStyledItemDelegate, QLineEdit
 )
-from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QStringListModel
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QStringListModel, QAbstractTableModel, QModelIndex, QTimer,
+    QSignalBlocker
+)
 from PyQt5.QtGui import QColor
+import numpy as np
+from utils.symbol_index import create_symbol_index
+
+ADD_ROW_TEXT = "+ Click to add..."
+
+# Pending ticks are flushed to the model at most once per frame (~30 Hz)
+FLUSH_INTERVAL_MS = 33
+
+# Initial row capacity of the QuoteModel price arrays (doubled as needed)
+INITIAL_CAPACITY = 256
+
+# Shared colors/flags so data() never parses a color string per call
+_GREEN = QColor("#4caf50")
+_RED = QColor("#f44336")
+_GREY = QColor("#808080")
+_ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+_FLAGS_RO = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+_FLAGS_ADD = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+# Roles QuoteModel.data() answers; the view asks for many more per cell
+_DATA_ROLES = frozenset((
+    Qt.DisplayRole, Qt.EditRole, Qt.ForegroundRole, Qt.TextAlignmentRole, Qt.UserRole
+))
+
+
+class QuoteModel(QAbstractTableModel):
+    """
+    Table model for Market Watch quotes.
+    Quotes are stored column-wise: bid/ask prices live in float64 arrays so
+    a batch of ticks is diffed and written in one vectorized step, while
+    names, colors and display strings (formatted once per tick, not once
+    per paint) live in parallel lists. The last row is the
+    "+ Click to add..." sentinel, which is editable but never stored.
+    """
+    
+    HEADERS = ["Symbol", "Bid", "Ask"]
+    
+    # Emitted when the user types a symbol into the add row
+    symbol_entered = pyqtSignal(str)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index = {}  # Symbol name -> row
+        self._add_row_index = 0  # Row of the "+ Click to add..." sentinel
+        
+        self._names = []
+        self._colors = []
+        self._bids = np.zeros(INITIAL_CAPACITY, dtype=np.float64)
+        self._asks = np.zeros(INITIAL_CAPACITY, dtype=np.float64)
+        
+        # Display strings per column: (labels, bid texts, ask texts)
+        self._texts = ([], [], [])
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._add_row_index + 1
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def is_add_row(self, row: int) -> bool:
+        """Check if a row is the "+ Click to add..." sentinel."""
+        return row == self._add_row_index
+        
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if self.is_add_row(index.row()):
+            if index.column() == 0:
+                return _FLAGS_ADD
+            return Qt.NoItemFlags
+        return _FLAGS_RO
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in _DATA_ROLES or not index.isValid():
+            return None
+            
+        row, col = index.row(), index.column()
+        
+        if self.is_add_row(row):
+            if col != 0:
+                return None
+            if role == Qt.DisplayRole:
+                return ADD_ROW_TEXT
+            elif role == Qt.EditRole:
+                return ""
+            elif role == Qt.ForegroundRole:
+                return _GREY
+            return None
+            
+        if role == Qt.DisplayRole:
+            return self._texts[col][row]
+        elif role == Qt.ForegroundRole:
+            if col == 0:
+                return self._colors[row]
+        elif role == Qt.TextAlignmentRole:
+            if col != 0:
+                return _ALIGN_RIGHT
+        elif role == Qt.UserRole:
+            # Raw symbol name, independent of how the row is displayed
+            return self._names[row]
+        return None
+        
+    def setData(self, index, value, role=Qt.EditRole):
+        """Accept a new symbol typed into the add row."""
+        if role != Qt.EditRole or not self.is_add_row(index.row()) or index.column() != 0:
+            return False
+            
+        symbol = str(value).strip()
+        if symbol and symbol != ADD_ROW_TEXT:
+            self.symbol_entered.emit(symbol)
+        return False
+        
+    def update_symbol(self, symbol):
+        """Insert or update a quote row."""
+        self.update_symbols([symbol])
+        
+    def update_symbols(self, symbols):
+        """
+        Insert or update a batch of quote rows.
+        Unknown symbols are first appended with a single insert, then all
+        rows are updated with a single dataChanged spanning the batch.
+        """
+        symbols = list(symbols)
+        
+        new_names = [symbol.name for symbol in symbols if symbol.name not in self._index]
+        if new_names:
+            self.set_universe(new_names)
+            
+        # Bind lookups once; this loop runs for every symbol in the batch
+        find_row = self._index.get
+        colors = self._colors
+        rows, bids, asks = [], [], []
+        
+        for symbol in symbols:
+            row = find_row(symbol.name)
+            rows.append(row)
+            bids.append(symbol.bid)
+            asks.append(symbol.ask)
+            colors[row] = _GREEN if symbol.trend == "up" else _RED
+            
+        if rows:
+            idx = np.array(rows, dtype=np.intp)
+            _, bid_texts, ask_texts = self._texts
+            
+            # Diff and write each price column in one go; only moved prices are re-formatted
+            for column, values, texts in ((self._bids, bids, bid_texts), (self._asks, asks, ask_texts)):
+                values = np.array(values, dtype=np.float64)
+                for i in np.flatnonzero(column[idx] != values).tolist():
+                    texts[rows[i]] = f"{values[i]:.2f}"
+                column[idx] = values
+                
+            self.dataChanged.emit(
+                self.index(min(rows), 0), self.index(max(rows), 2), [Qt.DisplayRole, Qt.ForegroundRole]
+            )
+            
+    def set_universe(self, names):
+        """
+        Preallocate rows for a known list of symbols in a single insert.
+        Rows show "-" until their first tick arrives; names already in the
+        model are skipped.
+        """
+        names = [name for name in dict.fromkeys(names) if name not in self._index]
+        if not names:
+            return
+            
+        # Add new rows before the "add" row
+        start = self._add_row_index
+        end = start + len(names)
+        self._reserve(end)
+        
+        labels, bid_texts, ask_texts = self._texts
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._names.extend(names)
+        self._colors.extend([_GREY] * len(names))
+        # NaN never equals a price, so the first tick always formats the cell
+        self._bids[start:end] = np.nan
+        self._asks[start:end] = np.nan
+        labels.extend(f"● {name}" for name in names)
+        bid_texts.extend(["-"] * len(names))
+        ask_texts.extend(["-"] * len(names))
+        self._index.update(zip(names, range(start, end)))
+        self._add_row_index = end
+        self.endInsertRows()
+        
+    def _reserve(self, size: int):
+        """Grow the price arrays (doubling) so they hold at least ``size`` rows."""
+        capacity = len(self._bids)
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        self._bids = np.resize(self._bids, capacity)
+        self._asks = np.resize(self._asks, capacity)
+
+
+class SymbolCompleter(QCompleter):
+    """
+    Completer backed by a symbol index (SQLite FTS5 or trigram dict).
+    On every prefix change the popup model is refilled with at most
+    MAX_CANDIDATES pre-filtered symbols, so Qt's own MatchContains pass
+    only ever scans that short list instead of the full universe.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index = create_symbol_index()
+        self._model = QStringListModel(self)
+        self._last_text = None
+        self.setModel(self._model)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setFilterMode(Qt.MatchContains)
+        
+    def set_symbols(self, symbols):
+        """Rebuild the index from a new symbol list."""
+        self._index.set_symbols(symbols)
+        self._last_text = None
+        
+    def splitPath(self, path):
+        # Only hit the index when the typed text actually changed
+        if path != self._last_text:
+            self._last_text = path
+            self._model.setStringList(self._index.candidates(path))
+        return [path]
+
 
 class SymbolDelegate(QStyledItemDelegate):
     """Delegate to handle autocomplete in the table."""
     def __init__(self, parent=None):
         super().__init__(parent)
         self.completer = None
-
+        
     def setCompleter(self, completer):
         self.completer = completer
-
+        
     def createEditor(self, parent, option, index):
         editor = QLineEdit(parent)
         if self.completer:
@@ -31,7 +264,14 @@ class MarketWatch(QDockWidget):
     def __init__(self, parent=None):
         super().__init__("Market Watch", parent)
         self.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
-        self.row_map = {} # Symbol name -> Row index
+        
+        # Ticks received since the last flush, keyed by symbol name
+        self._pending = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
         self._init_ui()
         
     def _init_ui(self):
@@ -40,136 +280,127 @@ class MarketWatch(QDockWidget):
         self.tabs = QTabWidget()
         
         # Symbols tab
-        self.symbols_table = QTableWidget(0, 3)
-        self.symbols_table.setHorizontalHeaderLabels(["Symbol", "Bid", "Ask"])
+        self.quote_model = QuoteModel(self)
+        self.quote_model.symbol_entered.connect(self._on_symbol_entered)
+        
+        self.symbols_table = QTableView()
+        self.symbols_table.setModel(self.quote_model)
         self.symbols_table.horizontalHeader().setStretchLastSection(True)
         self.symbols_table.setAlternatingRowColors(True)
-        self.symbols_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.symbols_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         
-        # Allow editing for the "add" row
-        self.symbols_table.setEditTriggers(QTableWidget.DoubleClicked | QTableWidget.EditKeyPressed | QTableWidget.AnyKeyPressed)
+        # Allow editing for the "add" row (the model only makes that cell editable)
+        self.symbols_table.setEditTriggers(
+            QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed | QAbstractItemView.AnyKeyPressed
+        )
         
         self.symbols_table.doubleClicked.connect(self._on_table_double_click)
-        self.symbols_table.cellChanged.connect(self._on_cell_changed)
         
         # Set custom delegate for the first column (Symbol)
         self.symbol_delegate = SymbolDelegate(self.symbols_table)
         self.symbols_table.setItemDelegateForColumn(0, self.symbol_delegate)
         
+        # One completer shared by all editors; its index is rebuilt in place
+        self._completer = SymbolCompleter(self)
+        self.symbol_delegate.setCompleter(self._completer)
+        
         self.tabs.addTab(self.symbols_table, "Symbols")
-        self.tabs.addTab(QLabel("Details view"), "Details")
-        self.tabs.addTab(QLabel("Trading view"), "Trading")
-        self.tabs.addTab(QLabel("Ticks view"), "Ticks")
+        
+        # Other tabs start as empty placeholders and are built on first activation
+        self._tab_builders = {
+            1: self._build_details,
+            2: self._build_trading,
+            3: self._build_ticks,
+        }
+        self.tabs.addTab(QWidget(), "Details")
+        self.tabs.addTab(QWidget(), "Trading")
+        self.tabs.addTab(QWidget(), "Ticks")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         self.setWidget(self.tabs)
         
-        # Initialize with just the "add" row
-        self._ensure_add_row()
+    def _on_tab_changed(self, index: int):
+        """Build a tab's real widget the first time it is shown."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+            
+        placeholder = self.tabs.widget(index)
+        title = self.tabs.tabText(index)
+        
+        # Removing the current tab selects a neighbour; keep that from building it
+        with QSignalBlocker(self.tabs):
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, builder(), title)
+            self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+        
+    def _build_details(self):
+        return QLabel("Details view")
+        
+    def _build_trading(self):
+        return QLabel("Trading view")
+        
+    def _build_ticks(self):
+        return QLabel("Ticks view")
         
     def set_search_completer(self, symbols: list):
         """Set the list of symbols for autocomplete."""
-        completer = QCompleter(symbols, self)
-        completer.setCaseSensitivity(Qt.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchContains)
-        self.symbol_delegate.setCompleter(completer)
-        
-    def _ensure_add_row(self):
-        """Ensure the 'click to add' row exists at the bottom."""
-        row_count = self.symbols_table.rowCount()
-        
-        # Check if last row is already the add row
-        if row_count > 0:
-            item = self.symbols_table.item(row_count - 1, 0)
-            if item and item.text() == "+ Click to add...":
-                return
-
-        # Add new row
-        self.symbols_table.insertRow(row_count)
-        last_row = row_count
-        
-        add_item = QTableWidgetItem("+ Click to add...")
-        add_item.setForeground(QColor("#808080"))
-        add_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable)
-        self.symbols_table.setItem(last_row, 0, add_item)
-        
-        # Empty items for other columns
-        self.symbols_table.setItem(last_row, 1, QTableWidgetItem(""))
-        self.symbols_table.setItem(last_row, 2, QTableWidgetItem(""))
-        
-        # Make other columns read-only
-        self.symbols_table.item(last_row, 1).setFlags(Qt.NoItemFlags)
-        self.symbols_table.item(last_row, 2).setFlags(Qt.NoItemFlags)
-
+        self._completer.set_symbols(symbols)
+        
+    def set_universe(self, symbols: list):
+        """
+        Pre-populate Market Watch with a known list of symbol names.
+        All rows are allocated in one insert; later ticks only update them.
+        """
+        with self._frozen_table():
+            self.quote_model.set_universe(symbols)
+            
     def _on_table_double_click(self, index):
         """Handle double click on symbol table."""
-        row = index.row()
-        # Ignore double click on the "add" row (last row)
-        if row == self.symbols_table.rowCount() - 1:
-            return
-            
-        symbol_item = self.symbols_table.item(row, 0)
-        if symbol_item:
-            # Extract symbol name (remove the "● " prefix)
-            symbol_text = symbol_item.text()
-            symbol_name = symbol_text.replace("● ", "")
+        # The "add" row has no UserRole name, so double clicks on it are ignored
+        symbol_name = index.data(Qt.UserRole)
+        if symbol_name:
             self.symbol_double_clicked.emit(symbol_name)
             
-    def _on_cell_changed(self, row, column):
-        """Handle cell changes (for adding new symbols)."""
-        # Check if it's the last row and first column
-        if row == self.symbols_table.rowCount() - 1 and column == 0:
-            item = self.symbols_table.item(row, column)
-            if item and item.text().strip() and item.text() != "+ Click to add...":
-                symbol = item.text().strip()
-                
-                # Emit signal
-                self.symbol_added.emit(symbol)
-                
-                # Reset the item to placeholder
-                self.symbols_table.blockSignals(True)
-                item.setText("+ Click to add...")
-                item.setForeground(QColor("#808080"))
-                self.symbols_table.blockSignals(False)
-                self.symbols_table.clearSelection()
-
+    def _on_symbol_entered(self, symbol: str):
+        """Handle a new symbol typed into the add row."""
+        self.symbol_added.emit(symbol)
+        self.symbols_table.clearSelection()
+        
     def update_tick(self, symbol):
-        """Update a single symbol tick."""
-        name = symbol.name
-        
-        # Find row
-        if name in self.row_map:
-            row = self.row_map[name]
-        else:
-            # Add new row before the "add" row
-            row = self.symbols_table.rowCount() - 1
-            self.symbols_table.insertRow(row)
-            self.row_map[name] = row
+        """Queue a single symbol tick; it is applied on the next flush."""
+        self._pending[symbol.name] = symbol
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
             
-            # Initialize items
-            self.symbols_table.setItem(row, 0, QTableWidgetItem())
-            self.symbols_table.setItem(row, 1, QTableWidgetItem())
-            self.symbols_table.setItem(row, 2, QTableWidgetItem())
-            
-        # Update items
-        # Symbol name with color indicator
-        symbol_item = self.symbols_table.item(row, 0)
-        symbol_item.setText(f"● {name}")
-        symbol_item.setForeground(QColor("#4caf50") if symbol.trend == "up" else QColor("#f44336"))
-        symbol_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        
-        # Bid price
-        bid_item = self.symbols_table.item(row, 1)
-        bid_item.setText(f"{symbol.bid:.2f}")
-        bid_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        bid_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-        
-        # Ask price
-        ask_item = self.symbols_table.item(row, 2)
-        ask_item.setText(f"{symbol.ask:.2f}")
-        ask_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        ask_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-
     def update_quotes(self, quotes: list):
         """Batch update quotes (legacy support)."""
         for symbol in quotes:
-            self.update_tick(symbol)
+            self._pending[symbol.name] = symbol
+        if quotes and not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    def _flush_pending(self):
+        """Apply all queued ticks to the model in one batch."""
+        if not self._pending:
+            return
+            
+        pending, self._pending = self._pending, {}
+        
+        # New symbols are inserted here too, so inserts share the single paint
+        with self._frozen_table():
+            self.quote_model.update_symbols(pending.values())
+            
+    @contextmanager
+    def _frozen_table(self):
+        """Suspend repaints/sorting so a batch of model changes produces a single paint."""
+        table = self.symbols_table
+        sorting_was_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            yield table
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_was_enabled)
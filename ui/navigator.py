@@ -2,11 +2,31 @@
 Navigator Widget.
 Displays accounts, indicators, strategies, and scripts in a tree view.
 """
-from PyQt5.QtWidgets import QDockWidget, QTreeWidget, QTreeWidgetItem
+from PyQt5.QtWidgets import QDockWidget, QTreeView, QAbstractItemView
 from PyQt5.QtCore import Qt, pyqtSignal
-from typing import List
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from typing import Dict, List, Optional
 from core.interfaces.plugin import Plugin, Indicator, Strategy, Script
 
+# Item data role holding the plugin type ("Indicator", "Strategy", "Script")
+PLUGIN_TYPE_ROLE = Qt.UserRole + 1
+
+# Plugin base class -> plugin type, checked in order
+_PLUGIN_KINDS = ((Indicator, "Indicator"), (Strategy, "Strategy"), (Script, "Script"))
+
+# Concrete plugin class -> plugin type (None for unknown classes)
+_KIND_CACHE: Dict[type, Optional[str]] = {}
+
+
+def _plugin_kind(cls: type) -> Optional[str]:
+    """Resolve a plugin class to its type, walking the MRO only once per class."""
+    try:
+        return _KIND_CACHE[cls]
+    except KeyError:
+        kind = next((k for base, k in _PLUGIN_KINDS if issubclass(cls, base)), None)
+        _KIND_CACHE[cls] = kind
+        return kind
+
 class Navigator(QDockWidget):
     """Navigator dock widget."""
     
@@ -19,49 +39,58 @@ class Navigator(QDockWidget):
         
     def _init_ui(self):
         """Initialize UI components."""
-        self.tree = QTreeWidget()
+        self.model = QStandardItemModel(self)
+        
+        self.tree = QTreeView()
+        self.tree.setModel(self.model)
         self.tree.setHeaderHidden(True)
-        self.tree.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self.tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tree.doubleClicked.connect(self._on_item_double_clicked)
         
         # Create root items
-        self.accounts_root = QTreeWidgetItem(self.tree, ["Accounts"])
-        self.indicators_root = QTreeWidgetItem(self.tree, ["Indicators"])
-        self.strategies_root = QTreeWidgetItem(self.tree, ["Expert Advisors"])
-        self.scripts_root = QTreeWidgetItem(self.tree, ["Scripts"])
-        
+        self.accounts_root = QStandardItem("Accounts")
+        self.indicators_root = QStandardItem("Indicators")
+        self.strategies_root = QStandardItem("Expert Advisors")
+        self.scripts_root = QStandardItem("Scripts")
+        for root in (self.accounts_root, self.indicators_root, self.strategies_root, self.scripts_root):
+            self.model.appendRow(root)
+            
         # Add dummy account
-        demo_acc = QTreeWidgetItem(self.accounts_root, ["Demo Account (10000 USD)"])
-        demo_acc.setIcon(0, self.style().standardIcon(self.style().SP_ComputerIcon))
+        demo_acc = QStandardItem(self.style().standardIcon(self.style().SP_ComputerIcon),
+                                 "Demo Account (10000 USD)")
+        self.accounts_root.appendRow(demo_acc)
         
         self.tree.expandAll()
         self.setWidget(self.tree)
         
     def update_plugins(self, plugins: List[Plugin]):
         """Update the tree with available plugins."""
-        # Clear existing plugin items
-        self.indicators_root.takeChildren()
-        self.strategies_root.takeChildren()
-        self.scripts_root.takeChildren()
+        # Build each category's rows first, then swap them in with one insert each
+        roots = {"Indicator": self.indicators_root, "Strategy": self.strategies_root, "Script": self.scripts_root}
+        rows = {kind: [] for kind in roots}
+        role = PLUGIN_TYPE_ROLE
         
         for plugin in plugins:
-            if isinstance(plugin, Indicator):
-                item = QTreeWidgetItem(self.indicators_root, [plugin.name])
-                item.setToolTip(0, plugin.description)
-                item.setData(0, Qt.UserRole, "Indicator")
-            elif isinstance(plugin, Strategy):
-                item = QTreeWidgetItem(self.strategies_root, [plugin.name])
-                item.setToolTip(0, plugin.description)
-                item.setData(0, Qt.UserRole, "Strategy")
-            elif isinstance(plugin, Script):
-                item = QTreeWidgetItem(self.scripts_root, [plugin.name])
-                item.setToolTip(0, plugin.description)
-                item.setData(0, Qt.UserRole, "Script")
+            kind = _plugin_kind(type(plugin))
+            if kind is None:
+                continue
                 
-        self.tree.expandAll()
+            item = QStandardItem(plugin.name)
+            item.setToolTip(plugin.description)
+            item.setData(kind, role)
+            rows[kind].append(item)
+            
+        for kind, items in rows.items():
+            root = roots[kind]
+            # Clear existing plugin items
+            root.removeRows(0, root.rowCount())
+            if items:
+                root.appendRows(items)
+            self.tree.expand(root.index())
 
-    def _on_item_double_clicked(self, item, column):
+    def _on_item_double_clicked(self, index):
         """Handle double click on tree item."""
-        plugin_type = item.data(0, Qt.UserRole)
+        plugin_type = index.data(PLUGIN_TYPE_ROLE)
         if plugin_type:
-            plugin_name = item.text(0)
+            plugin_name = index.data(Qt.DisplayRole)
             self.plugin_double_clicked.emit(plugin_name, plugin_type)
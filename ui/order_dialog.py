@@ -3,8 +3,41 @@ from PyQt5.QtWidgets import (
     QPushButton, QTabWidget, QWidget, QRadioButton, QButtonGroup,
     QFrame, QMessageBox, QComboBox, QSpinBox, QDoubleSpinBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QTimer, QThreadPool, QRunnable, QMetaObject, Q_ARG
+)
 from PyQt5.QtGui import QColor, QFont
+from utils.logger import logger
+
+# Delay after the last input change before the margin is recomputed
+MARGIN_DEBOUNCE_MS = 200
+
+
+class _MarginTask(QRunnable):
+    """Computes the required margin on a pool thread and posts it back to the dialog."""
+    
+    def __init__(self, dialog, seq, calculator, order):
+        super().__init__()
+        self.dialog = dialog
+        self.seq = seq
+        self.calculator = calculator
+        self.order = order
+        
+    def run(self):
+        try:
+            text = f"Margin Required: ₹{self.calculator(self.order):,.2f}"
+        except Exception as e:
+            logger.error(f"Margin calculation failed: {e}")
+            text = "Margin Required: N/A"
+            
+        try:
+            QMetaObject.invokeMethod(
+                self.dialog, "_apply_margin", Qt.QueuedConnection,
+                Q_ARG(int, self.seq), Q_ARG(str, text)
+            )
+        except RuntimeError:
+            pass  # Dialog was destroyed while we were computing
+
 
 class OrderDialog(QDialog):
     """
@@ -14,10 +47,29 @@ class OrderDialog(QDialog):
     
     order_placed = pyqtSignal(dict)  # Signal emitted when order is placed
     
-    def __init__(self, symbol, price=0.0, parent=None):
+    # Order type button text -> order type
+    _ORDER_TYPES = {"Market": "MARKET", "Limit": "LIMIT", "SL": "SL-L", "SL-M": "SL-M"}
+    
+    # Order type -> (price enabled, trigger enabled)
+    _TYPE_TO_SPIN_STATE = {
+        "MARKET": (False, False),
+        "LIMIT": (True, False),
+        "SL-L": (True, True),
+        "SL-M": (False, True),
+    }
+    
+    # Product -> fraction of order value blocked as margin (CNC is fully funded)
+    _MARGIN_FACTORS = {"C": 1.0, "I": 0.2}
+    
+    def __init__(self, symbol, price=0.0, parent=None, margin_calculator=None):
         super().__init__(parent)
         self.symbol = symbol
         self.current_price = price
+        
+        # Callable(order_data) -> margin; may block (e.g. a broker API call),
+        # so it always runs on the global thread pool
+        self.margin_calculator = margin_calculator or self._estimate_margin
+        self._margin_seq = 0
         self.setWindowTitle(f"Place Order - {symbol}")
         self.setFixedWidth(450)
         self.setStyleSheet("""
@@ -56,9 +108,16 @@ class OrderDialog(QDialog):
             }
         """)
         
-        self.is_buy = True
-        self.order_type = "MARKET" # MARKET, LIMIT, SL-M, SL-L
-        self.product_type = "I" # C (CNC/Delivery), I (MIS/Intraday)
+        # Single source of truth for the order form; handlers go through _set_state
+        self._state = {
+            "side": "BUY",     # BUY, SELL
+            "type": "MARKET",  # MARKET, LIMIT, SL-M, SL-L
+            "product": "I",    # C (CNC/Delivery), I (MIS/Intraday)
+        }
+        
+        # Action button stylesheets, built once per dialog
+        self._buy_qss = self._action_btn_qss("#4caf50")  # Green
+        self._sell_qss = self._action_btn_qss("#f44336")  # Red
         
         self._init_ui()
         
@@ -99,6 +158,13 @@ class OrderDialog(QDialog):
         self.btn_sl = self._create_type_btn("SL")
         self.btn_slm = self._create_type_btn("SL-M")
         
+        # Exclusive group: Qt keeps exactly one order type checked
+        self._type_group = QButtonGroup(self)
+        self._type_group.setExclusive(True)
+        for btn in (self.btn_market, self.btn_limit, self.btn_sl, self.btn_slm):
+            self._type_group.addButton(btn)
+        self._type_group.buttonClicked.connect(self._on_type_changed)
+        
         type_layout.addWidget(self.btn_market)
         type_layout.addWidget(self.btn_limit)
         type_layout.addWidget(self.btn_sl)
@@ -110,7 +176,7 @@ class OrderDialog(QDialog):
         self.toggle_buy = QRadioButton("Buy")
         self.toggle_sell = QRadioButton("Sell")
         self.toggle_buy.setChecked(True)
-        self.toggle_buy.toggled.connect(self._update_colors)
+        self.toggle_buy.toggled.connect(self._on_side_changed)
         
         self.toggle_layout.addWidget(QLabel("Side:"))
         self.toggle_layout.addWidget(self.toggle_buy)
@@ -170,13 +236,21 @@ class OrderDialog(QDialog):
         footer_layout.addStretch()
         layout.addLayout(footer_layout)
         
-        self._update_colors()
+        # Recompute margin once input settles, not on every spin step
+        self._margin_timer = QTimer(self)
+        self._margin_timer.setSingleShot(True)
+        self._margin_timer.setInterval(MARGIN_DEBOUNCE_MS)
+        self._margin_timer.timeout.connect(self._start_margin_calc)
+        self.qty_spin.valueChanged.connect(self._schedule_margin)
+        self.price_spin.valueChanged.connect(self._schedule_margin)
+        
+        self._refresh({"side", "type"})
+        self._schedule_margin()
         
     def _create_type_btn(self, text, checked=False):
         btn = QPushButton(text)
         btn.setCheckable(True)
         btn.setChecked(checked)
-        btn.clicked.connect(lambda: self._on_type_changed(btn))
         btn.setStyleSheet("""
             QPushButton {
                 background-color: #2d2d2d;
@@ -192,50 +266,73 @@ class OrderDialog(QDialog):
         """)
         return btn
         
+    @property
+    def is_buy(self):
+        return self._state["side"] == "BUY"
+        
+    @property
+    def order_type(self):
+        return self._state["type"]
+        
+    @property
+    def product_type(self):
+        return self._state["product"]
+        
     def _on_product_changed(self, index):
-        if index == 0:
-            self.product_type = "I" # MIS/Intraday
-        else:
-            self.product_type = "C" # CNC/Delivery
+        self._set_state(product="I" if index == 0 else "C")
             
     def _on_type_changed(self, active_btn):
-        # Uncheck others
-        for btn in [self.btn_market, self.btn_limit, self.btn_sl, self.btn_slm]:
-            if btn != active_btn:
-                btn.setChecked(False)
-        
-        active_btn.setChecked(True)
-        text = active_btn.text()
-        
-        if text == "Market":
-            self.order_type = "MARKET"
-            self.price_spin.setEnabled(False)
-            self.trig_spin.setEnabled(False)
-        elif text == "Limit":
-            self.order_type = "LIMIT"
-            self.price_spin.setEnabled(True)
-            self.trig_spin.setEnabled(False)
-        elif text == "SL":
-            self.order_type = "SL-L"
-            self.price_spin.setEnabled(True)
-            self.trig_spin.setEnabled(True)
-        elif text == "SL-M":
-            self.order_type = "SL-M"
-            self.price_spin.setEnabled(False)
-            self.trig_spin.setEnabled(True)
+        self._set_state(type=self._ORDER_TYPES[active_btn.text()])
+        
+    def _on_side_changed(self):
+        self._set_state(side="BUY" if self.toggle_buy.isChecked() else "SELL")
+        
+    def _set_state(self, **changes):
+        """Apply state changes and refresh only the parts of the UI they affect."""
+        changed = {key for key, value in changes.items() if self._state[key] != value}
+        if changed:
+            self._state.update(changes)
+            self._refresh(changed)
+            
+    def _refresh(self, changed):
+        """Re-apply the UI for the given set of changed state keys."""
+        if "side" in changed:
+            self.action_btn.setStyleSheet(self._buy_qss if self.is_buy else self._sell_qss)
+            self.action_btn.setText("Instant Buy" if self.is_buy else "Instant Sell")
+            
+        if "type" in changed:
+            price_enabled, trig_enabled = self._TYPE_TO_SPIN_STATE[self.order_type]
+            self.price_spin.setEnabled(price_enabled)
+            self.trig_spin.setEnabled(trig_enabled)
             
-    def _update_colors(self):
-        self.is_buy = self.toggle_buy.isChecked()
-        
-        if self.is_buy:
-            color = "#4caf50" # Green
-            text = "Instant Buy"
-        else:
-            color = "#f44336" # Red
-            text = "Instant Sell"
+        if changed & {"type", "product"}:
+            self._schedule_margin()
             
-        self.action_btn.setText(text)
-        self.action_btn.setStyleSheet(f"""
+    def _schedule_margin(self):
+        """(Re)start the margin debounce timer."""
+        self._margin_timer.start()
+        
+    def _start_margin_calc(self):
+        """Hand the margin calculation to the global thread pool."""
+        self._margin_seq += 1
+        task = _MarginTask(self, self._margin_seq, self.margin_calculator, self._order_data())
+        QThreadPool.globalInstance().start(task)
+        
+    @pyqtSlot(int, str)
+    def _apply_margin(self, seq, text):
+        # Drop results from calculations superseded by newer input
+        if seq == self._margin_seq:
+            self.margin_label.setText(text)
+            
+    def _estimate_margin(self, order):
+        """Default margin estimate: order value scaled by the product's margin factor."""
+        price = order["price"] or self.current_price
+        return order["quantity"] * price * self._MARGIN_FACTORS.get(order["product_type"], 1.0)
+        
+    @staticmethod
+    def _action_btn_qss(color):
+        """Build the action button stylesheet for a side color."""
+        return f"""
             QPushButton {{
                 background-color: {color};
                 color: white;
@@ -245,15 +342,15 @@ class OrderDialog(QDialog):
             QPushButton:hover {{
                 background-color: {QColor(color).lighter(110).name()};
             }}
-        """)
+        """
         
-    def _on_place_order(self):
+    def _order_data(self):
         # Gather data
         qty = self.qty_spin.value()
         price = self.price_spin.value()
         trigger = self.trig_spin.value()
         
-        order_data = {
+        return {
             "symbol": self.symbol,
             "side": "BUY" if self.is_buy else "SELL",
             "product_type": self.product_type,
@@ -263,5 +360,6 @@ class OrderDialog(QDialog):
             "trigger_price": trigger if "SL" in self.order_type else 0
         }
         
-        self.order_placed.emit(order_data)
+    def _on_place_order(self):
+        self.order_placed.emit(self._order_data())
         self.accept()
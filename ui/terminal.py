@@ -1,12 +1,290 @@
+from abc import ABCMeta, abstractmethod
 from PyQt5.QtWidgets import (
-    QDockWidget, QTabWidget, QTableWidget, QTableWidgetItem, 
+    QDockWidget, QTabWidget, QTableView, QAbstractItemView, QHeaderView,
     QLabel, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QStatusBar,
-    QTextEdit
+    QPlainTextEdit
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer
 from PyQt5.QtGui import QIcon, QColor
-from utils.worker_threads import OrderBookWorker, PositionBookWorker
-from datetime import datetime
+from utils.worker_threads import OrderBookWorker, PositionBookWorker, TradeTableWorker
+import time
+
+# Shared colors so rendering never parses a color string per cell
+_GREEN = QColor(0x4c, 0xaf, 0x50)
+_RED = QColor(0xf4, 0x43, 0x36)
+_BLUE = QColor(0x21, 0x96, 0xf3)
+_ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+
+# Fixed row height for all Terminal tables
+ROW_HEIGHT = 22
+
+# Tab switches within this window collapse into a single refresh
+TAB_REFRESH_DEBOUNCE_MS = 150
+
+# A tab refreshed more recently than this (seconds) is not refetched on switch
+TAB_REFRESH_MIN_AGE = 0.5
+
+# Journal keeps only the most recent lines (oldest are dropped)
+JOURNAL_MAX_LINES = 5000
+
+
+# Combined metaclass so the Qt model base can declare abstract methods
+class _ModelMeta(type(QAbstractTableModel), ABCMeta):
+    pass
+
+
+class RowTableModel(QAbstractTableModel, metaclass=_ModelMeta):
+    """
+    Read-only table model for the Terminal tables.
+    Each source row is rendered once into (text, foreground) cells when the
+    rows are set, so data() is a plain tuple lookup.
+    Subclasses define HEADERS and _render_row().
+    """
+    
+    HEADERS = []
+    
+    # Per-column TextAlignmentRole values (None = view default)
+    ALIGNMENTS = {}
+    
+    # Initial column widths in pixels; columns are never sized to contents
+    COLUMN_WIDTHS = ()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cells = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cells)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+        
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        if role == Qt.DisplayRole:
+            return self._cells[index.row()][index.column()][0]
+        elif role == Qt.ForegroundRole:
+            return self._cells[index.row()][index.column()][1]
+        elif role == Qt.TextAlignmentRole:
+            return self.ALIGNMENTS.get(index.column())
+        return None
+        
+    def set_rows(self, rows: list):
+        """Replace the table contents."""
+        self.beginResetModel()
+        self._rows = rows
+        self._cells = [self._render_row(row) for row in rows]
+        self.endResetModel()
+        
+    @abstractmethod
+    def _render_row(self, row) -> tuple:
+        """Render one source row into a tuple of (text, foreground) cells."""
+        pass
+
+
+class OrderBookModel(RowTableModel):
+    """Order Book rows as (order, time text) pairs from OrderBookWorker."""
+    
+    HEADERS = [
+        "Ticket", "Symbol", "Type", "Status", "Volume", "Price",
+        "Trigger", "Time", "Rejection Reason", "Comment", "Exchange ID"
+    ]
+    COLUMN_WIDTHS = (80, 120, 80, 80, 70, 80, 80, 80, 160, 120, 120)
+    
+    def _render_row(self, row) -> tuple:
+        order, time_text = row
+        order_type = order.order_type.value
+        type_color = _GREEN if "buy" in order_type.lower() else _RED
+        
+        status = order.status.value
+        if status == "active":
+            status_color = _BLUE
+        elif status == "filled":
+            status_color = _GREEN
+        elif status == "rejected":
+            status_color = _RED
+        else:
+            status_color = None
+            
+        return (
+            (str(order.ticket), None),
+            (order.symbol, None),
+            (order_type, type_color),
+            (status.upper(), status_color),
+            (str(order.volume), None),
+            (f"{order.open_price:.2f}", None),
+            ("", None),  # Trigger Price (placeholder)
+            (time_text, None),
+            (order.rejection_reason, None),
+            (order.comment, None),
+            ("", None),  # Exchange ID (placeholder)
+        )
+
+
+class PositionBookModel(RowTableModel):
+    """Position Book rows (broker position dicts)."""
+    
+    HEADERS = [
+        "Symbol", "Net Qty", "Avg Price", "LTP", "P&L", "M2M",
+        "Day Buy Qty", "Day Sell Qty", "Product", "CF Sell Qty", "Day Buy Amt", "Day Sell Amt"
+    ]
+    COLUMN_WIDTHS = (140, 70, 80, 80, 80, 80, 90, 90, 70, 90, 100, 100)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._keys = []
+        
+    @staticmethod
+    def _row_key(pos):
+        # The same symbol can be held under several products (MIS + CNC)
+        return pos.get('tsym', ''), pos.get('prd', '')
+        
+    def set_rows(self, positions: list):
+        """
+        Apply a fresh position book as a diff against the current rows.
+        Unchanged positions are skipped, changed ones emit dataChanged for
+        the affected columns only, and closed/new positions are removed/
+        inserted instead of resetting the whole model.
+        """
+        incoming = {self._row_key(pos): pos for pos in positions}
+        if len(incoming) != len(positions):
+            # Ambiguous keys; fall back to a plain reset
+            self._keys = [self._row_key(pos) for pos in positions]
+            super().set_rows(positions)
+            return
+            
+        # Remove closed positions (bottom-up so row numbers stay valid)
+        for row in range(len(self._keys) - 1, -1, -1):
+            if self._keys[row] not in incoming:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._keys[row], self._rows[row], self._cells[row]
+                self.endRemoveRows()
+                
+        # Update rows whose data moved
+        for row, key in enumerate(self._keys):
+            pos = incoming.pop(key)
+            if pos == self._rows[row]:
+                continue
+                
+            cells = self._render_row(pos)
+            changed = [col for col, cell in enumerate(cells) if cell != self._cells[row][col]]
+            self._rows[row] = pos
+            self._cells[row] = cells
+            if changed:
+                self.dataChanged.emit(
+                    self.index(row, changed[0]), self.index(row, changed[-1]),
+                    [Qt.DisplayRole, Qt.ForegroundRole]
+                )
+                
+        # Append new positions
+        if incoming:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(incoming) - 1)
+            for key, pos in incoming.items():
+                self._keys.append(key)
+                self._rows.append(pos)
+                self._cells.append(self._render_row(pos))
+            self.endInsertRows()
+            
+    def _render_row(self, pos) -> tuple:
+        net_qty = pos.get('netqty', '0')
+        qty = int(net_qty)
+        qty_color = _GREEN if qty > 0 else _RED if qty < 0 else None
+        
+        rpnl = float(pos.get('rpnl', '0.00'))      # Realized
+        urmtom = float(pos.get('urmtom', '0.00'))  # Unrealized
+        
+        return (
+            (pos.get('tsym', ''), None),
+            (net_qty, qty_color),
+            (pos.get('netavgprc', '0.00'), None),
+            (pos.get('lp', '0.00'), None),
+            (f"{rpnl:.2f}", _GREEN if rpnl >= 0 else _RED),
+            (f"{urmtom:.2f}", _GREEN if urmtom >= 0 else _RED),
+            (pos.get('daybuyqty', '0'), None),
+            (pos.get('daysellqty', '0'), None),
+            (pos.get('prd', '0'), None),
+            (pos.get('cfsellqty', '0'), None),
+            (pos.get('daybuyamt', '0.00'), None),
+            (pos.get('daysellamt', '0.00'), None),
+        )
+
+
+class TradeTableModel(RowTableModel):
+    """Trade (open positions) rows as (order, profit, time text) from TradeTableWorker."""
+    
+    HEADERS = ["Symbol", "Ticket", "Time", "Type", "Volume", "Price", "S/L", "T/P", "Profit"]
+    ALIGNMENTS = {8: _ALIGN_RIGHT}
+    COLUMN_WIDTHS = (120, 80, 120, 80, 70, 90, 90, 90, 90)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Ticket -> (inputs the row was rendered from, rendered cells)
+        self._render_cache = {}
+        self._tickets = []
+        
+    def set_rows(self, rows: list):
+        """
+        Replace the table contents, re-rendering only trades whose volume,
+        prices, S/L, T/P or profit changed since the last refresh.
+        """
+        cache = {}
+        cells = []
+        for row in rows:
+            order, profit, _ = row
+            key = (order.volume, order.open_price, order.sl, order.tp, profit)
+            cached = self._render_cache.get(order.ticket)
+            if cached is None or cached[0] != key:
+                cached = (key, self._render_row(row))
+            cache[order.ticket] = cached
+            cells.append(cached[1])
+        # Dropping the old dict also evicts closed trades
+        self._render_cache = cache
+        
+        tickets = [row[0].ticket for row in rows]
+        if tickets == self._tickets:
+            # Same trades in the same order: repaint in place so the
+            # selection and scroll position survive the refresh
+            self._rows = rows
+            self._cells = cells
+            if cells:
+                self.dataChanged.emit(
+                    self.index(0, 0),
+                    self.index(len(cells) - 1, len(self.HEADERS) - 1),
+                    [Qt.DisplayRole, Qt.ForegroundRole]
+                )
+        else:
+            self.beginResetModel()
+            self._tickets = tickets
+            self._rows = rows
+            self._cells = cells
+            self.endResetModel()
+            
+    def _render_row(self, row) -> tuple:
+        order, profit, time_text = row
+        return (
+            (order.symbol, None),
+            (str(order.ticket), None),
+            (time_text, None),
+            (order.order_type.value, None),
+            (f"{order.volume:.2f}", None),
+            (f"{order.open_price:.5f}", None),
+            (f"{order.sl:.5f}" if order.sl > 0 else "0.00000", None),
+            (f"{order.tp:.5f}" if order.tp > 0 else "0.00000", None),
+            (f"{profit:.2f}", _GREEN if profit >= 0 else _RED),
+        )
+
 
 class Terminal(QDockWidget):
     """Terminal dock widget."""
@@ -14,6 +292,22 @@ class Terminal(QDockWidget):
     def __init__(self, broker, parent=None):
         super().__init__("Terminal", parent)
         self.broker = broker
+        self._trade_refresh_pending = False
+        
+        # Broker tasks in flight, by table ('order', 'trade', 'position')
+        self._tasks = {}
+        
+        # Book refreshes requested this event-loop pass (coalesced into one)
+        self._refresh_pending = {'order': False, 'position': False}
+        
+        # Tab-switch refreshes: last requested tab and last refresh time per tab
+        self._pending_tab = None
+        self._last_refresh_ts = {}
+        self._refresh_debouncer = QTimer(self)
+        self._refresh_debouncer.setSingleShot(True)
+        self._refresh_debouncer.setInterval(TAB_REFRESH_DEBOUNCE_MS)
+        self._refresh_debouncer.timeout.connect(self._refresh_pending_tab)
+        
         self.setAllowedAreas(Qt.BottomDockWidgetArea)
         self._init_ui()
         
@@ -33,10 +327,10 @@ class Terminal(QDockWidget):
         self.terminal_tabs.currentChanged.connect(self._on_tab_changed)
         
         # Trade tab
-        self.trade_table = QTableWidget(0, 9)
-        self.trade_table.setHorizontalHeaderLabels([
-            "Symbol", "Ticket", "Time", "Type", "Volume", "Price", "S/L", "T/P", "Profit"
-        ])
+        self.trade_model = TradeTableModel(self)
+        self.trade_table = QTableView()
+        self.trade_table.setModel(self.trade_model)
+        self._setup_table(self.trade_table)
         self.trade_table.horizontalHeader().setStretchLastSection(True)
         self.trade_table.setAlternatingRowColors(True)
         self.terminal_tabs.addTab(self.trade_table, "Trade")
@@ -59,11 +353,13 @@ class Terminal(QDockWidget):
         self.terminal_tabs.addTab(alerts_widget, "Alerts")
         
         # Journal tab
-        self.journal_widget = QTextEdit()
+        self.journal_widget = QPlainTextEdit()
         self.journal_widget.setReadOnly(True)
+        self.journal_widget.setMaximumBlockCount(JOURNAL_MAX_LINES)
+        self.journal_widget.setCenterOnScroll(False)
         self.journal_widget.setStyleSheet("font-family: monospace; background-color: #1e1e1e; color: #d4d4d4;")
-        self.journal_widget.append(f"[{datetime.now().strftime('%H:%M:%S')}] [INFO] Application started")
-        self.journal_widget.append(f"[{datetime.now().strftime('%H:%M:%S')}] [INFO] Connected to Demo Server")
+        self.journal_widget.appendPlainText(f"[{time.strftime('%H:%M:%S')}] [INFO] Application started")
+        self.journal_widget.appendPlainText(f"[{time.strftime('%H:%M:%S')}] [INFO] Connected to Demo Server")
         self.terminal_tabs.addTab(self.journal_widget, "Journal")
         
         # Order Book tab
@@ -77,6 +373,18 @@ class Terminal(QDockWidget):
         terminal_layout.addWidget(self.terminal_tabs)
         self.setWidget(terminal_widget)
         
+    @staticmethod
+    def _setup_table(view):
+        """Use fixed row heights and preset column widths so Qt never measures cell contents."""
+        vheader = view.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setMinimumSectionSize(ROW_HEIGHT)  # Font-derived minimum can exceed it
+        vheader.setDefaultSectionSize(ROW_HEIGHT)
+        
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        for col, width in enumerate(view.model().COLUMN_WIDTHS):
+            view.setColumnWidth(col, width)
+            
     def _create_account_info_bar(self):
         """Create account information bar."""
         bar = QWidget()
@@ -122,114 +430,87 @@ class Terminal(QDockWidget):
         layout.addLayout(toolbar)
         
         # Table
-        self.order_book_table = QTableWidget(0, 11)
-        self.order_book_table.setHorizontalHeaderLabels([
-            "Ticket", "Symbol", "Type", "Status", "Volume", "Price", 
-            "Trigger", "Time", "Rejection Reason", "Comment", "Exchange ID"
-        ])
+        self.order_book_model = OrderBookModel(self)
+        self.order_book_table = QTableView()
+        self.order_book_table.setModel(self.order_book_model)
+        self._setup_table(self.order_book_table)
         self.order_book_table.horizontalHeader().setStretchLastSection(True)
         self.order_book_table.setAlternatingRowColors(True)
-        self.order_book_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.order_book_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.order_book_table)
         
         return widget
         
     def _on_tab_changed(self, index):
-        """Handle terminal tab change."""
+        """Handle terminal tab change (refresh is debounced)."""
         tab_text = self.terminal_tabs.tabText(index)
+        if tab_text in ("Order Book", "Position Book"):
+            self._pending_tab = tab_text
+            self._refresh_debouncer.start()
+        else:
+            # Left before the debounce fired; nothing to refresh
+            self._pending_tab = None
+            self._refresh_debouncer.stop()
+            
+    def _refresh_pending_tab(self):
+        """Refresh the last tab switched to, unless it is still fresh."""
+        tab_text, self._pending_tab = self._pending_tab, None
+        now = time.monotonic()
+        if now - self._last_refresh_ts.get(tab_text, float('-inf')) < TAB_REFRESH_MIN_AGE:
+            return
+        self._last_refresh_ts[tab_text] = now
+        
         if tab_text == "Order Book":
             self.refresh_order_book()
         elif tab_text == "Position Book":
             self.refresh_position_book()
             
     def refresh_order_book(self):
-        """Refresh order book data."""
-        if not hasattr(self, 'order_book_worker'):
-            self.order_book_worker = OrderBookWorker(self.broker)
-            self.order_book_worker.data_received.connect(self._update_order_book_table)
-            # Note: Error handling via status bar needs parent access or signal
-            # For now, we'll just print to console/log
-        
-        if not self.order_book_worker.isRunning():
-            self.order_book_worker.start()
-            
-    def _update_order_book_table(self, orders):
-        """Update Order Book table with data."""
-        self.order_book_table.setRowCount(len(orders))
-        
-        for row, order in enumerate(orders):
-            # Ticket
-            self.order_book_table.setItem(row, 0, QTableWidgetItem(str(order.ticket)))
-            
-            # Symbol
-            self.order_book_table.setItem(row, 1, QTableWidgetItem(order.symbol))
-            
-            # Type
-            type_item = QTableWidgetItem(order.order_type.value)
-            if "buy" in order.order_type.value.lower():
-                type_item.setForeground(QColor("#4caf50"))
-            else:
-                type_item.setForeground(QColor("#f44336"))
-            self.order_book_table.setItem(row, 2, type_item)
-            
-            # Status
-            status_item = QTableWidgetItem(order.status.value.upper())
-            if order.status.value == "active":
-                status_item.setForeground(QColor("#2196f3"))
-            elif order.status.value == "filled":
-                status_item.setForeground(QColor("#4caf50"))
-            elif order.status.value == "rejected":
-                status_item.setForeground(QColor("#f44336"))
-            self.order_book_table.setItem(row, 3, status_item)
-            
-            # Volume
-            self.order_book_table.setItem(row, 4, QTableWidgetItem(str(order.volume)))
-            
-            # Price
-            self.order_book_table.setItem(row, 5, QTableWidgetItem(f"{order.open_price:.2f}"))
+        """Refresh order book data (repeated calls in one pass run once)."""
+        if not self._refresh_pending['order']:
+            self._refresh_pending['order'] = True
+            QTimer.singleShot(0, self._do_refresh_order_book)
             
-            # Trigger Price (placeholder)
-            self.order_book_table.setItem(row, 6, QTableWidgetItem(""))
+    def _do_refresh_order_book(self):
+        """Start the order book worker unless it is already running."""
+        self._refresh_pending['order'] = False
+        if 'order' in self._tasks:
+            return
             
-            # Time
-            time_str = order.open_time.strftime("%H:%M:%S") if order.open_time else ""
-            self.order_book_table.setItem(row, 7, QTableWidgetItem(time_str))
+        worker = OrderBookWorker(self.broker)
+        worker.signals.data_received.connect(self._update_order_book_table)
+        # Note: Error handling via status bar needs parent access or signal
+        # For now, we'll just print to console/log
+        self._start_task('order', worker)
             
-            # Rejection Reason
-            self.order_book_table.setItem(row, 8, QTableWidgetItem(order.rejection_reason))
-            
-            # Comment
-            self.order_book_table.setItem(row, 9, QTableWidgetItem(order.comment))
-            
-            # Exchange ID (placeholder)
-            self.order_book_table.setItem(row, 10, QTableWidgetItem(""))
+    def _update_order_book_table(self, orders):
+        """Update Order Book table with data."""
+        self.order_book_model.set_rows(orders)
             
     def update_trade_table(self):
-        """Update Trade (open positions) table."""
-        orders = self.broker.get_open_orders()
-        self.trade_table.setRowCount(len(orders))
-        
-        for row, order in enumerate(orders):
-            symbol_info = self.broker.get_symbol_info(order.symbol)
-            current_price = symbol_info.bid if symbol_info else order.open_price
-            profit = order.calculate_profit(current_price)
-            
-            self.trade_table.setItem(row, 0, QTableWidgetItem(order.symbol))
-            self.trade_table.setItem(row, 1, QTableWidgetItem(str(order.ticket)))
-            self.trade_table.setItem(row, 2, QTableWidgetItem(order.open_time.strftime("%Y.%m.%d %H:%M")))
-            self.trade_table.setItem(row, 3, QTableWidgetItem(order.order_type.value))
-            self.trade_table.setItem(row, 4, QTableWidgetItem(f"{order.volume:.2f}"))
-            self.trade_table.setItem(row, 5, QTableWidgetItem(f"{order.open_price:.5f}"))
-            self.trade_table.setItem(row, 6, QTableWidgetItem(f"{order.sl:.5f}" if order.sl > 0 else "0.00000"))
-            self.trade_table.setItem(row, 7, QTableWidgetItem(f"{order.tp:.5f}" if order.tp > 0 else "0.00000"))
+        """Refresh the Trade (open positions) table in the background."""
+        if 'trade' in self._tasks:
+            # Orders changed while fetching; fetch again once this pass is done
+            self._trade_refresh_pending = True
+            return
             
-            # Profit with color
-            profit_item = QTableWidgetItem(f"{profit:.2f}")
-            profit_item.setForeground(QColor("#4caf50") if profit >= 0 else QColor("#f44336"))
-            profit_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.trade_table.setItem(row, 8, profit_item)
+        worker = TradeTableWorker(self.broker)
+        worker.signals.data_received.connect(self.trade_model.set_rows)
+        self._start_task('trade', worker)
+        
+    def _start_task(self, name, worker):
+        """Run a broker task on the shared pool, remembering it until it finishes."""
+        self._tasks[name] = worker
+        worker.signals.finished.connect(lambda: self._on_task_finished(name))
+        worker.start()
+        
+    def _on_task_finished(self, name):
+        """Forget a finished task; run a trade refresh requested meanwhile."""
+        del self._tasks[name]
+        if name == 'trade' and self._trade_refresh_pending:
+            self._trade_refresh_pending = False
+            self.update_trade_table()
             
-
     def update_account_info(self, account_info: dict):
         """Update account info bar."""
         self.balance_label.setText(f"Balance: {account_info['balance']:,.2f} USD")
@@ -246,12 +527,8 @@ class Terminal(QDockWidget):
 
     def log_message(self, message: str):
         """Log a message to the Journal tab."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.journal_widget.append(f"[{timestamp}] {message}")
-        # Scroll to bottom
-        cursor = self.journal_widget.textCursor()
-        cursor.movePosition(cursor.End)
-        self.journal_widget.setTextCursor(cursor)
+        # Follows the end automatically while the view is scrolled to the bottom
+        self.journal_widget.appendPlainText(f"[{time.strftime('%H:%M:%S')}] {message}")
 
     def _create_position_book_tab(self):
         """Create Position Book tab widget."""
@@ -269,70 +546,33 @@ class Terminal(QDockWidget):
         layout.addLayout(toolbar)
         
         # Table
-        self.position_book_table = QTableWidget(0, 12)
-        self.position_book_table.setHorizontalHeaderLabels([
-            "Symbol", "Net Qty", "Avg Price", "LTP", "P&L", "M2M", 
-            "Day Buy Qty", "Day Sell Qty", "Product", "CF Sell Qty", "Day Buy Amt", "Day Sell Amt"
-        ])
+        self.position_book_model = PositionBookModel(self)
+        self.position_book_table = QTableView()
+        self.position_book_table.setModel(self.position_book_model)
+        self._setup_table(self.position_book_table)
         self.position_book_table.horizontalHeader().setStretchLastSection(True)
         self.position_book_table.setAlternatingRowColors(True)
-        self.position_book_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.position_book_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         layout.addWidget(self.position_book_table)
         
         return widget
 
     def refresh_position_book(self):
-        """Refresh position book data."""
-        if not hasattr(self, 'position_book_worker'):
-            self.position_book_worker = PositionBookWorker(self.broker)
-            self.position_book_worker.data_received.connect(self._update_position_book_table)
-        
-        if not self.position_book_worker.isRunning():
-            self.position_book_worker.start()
-
-    def _update_position_book_table(self, positions):
-        """Update Position Book table with data."""
-        self.position_book_table.setRowCount(len(positions))
-        
-        for row, pos in enumerate(positions):
-            # Symbol
-            self.position_book_table.setItem(row, 0, QTableWidgetItem(pos.get('tsym', '')))
-            
-            # Net Qty
-            net_qty = pos.get('netqty', '0')
-            qty_item = QTableWidgetItem(net_qty)
-            if int(net_qty) > 0:
-                qty_item.setForeground(QColor("#4caf50"))
-            elif int(net_qty) < 0:
-                qty_item.setForeground(QColor("#f44336"))
-            self.position_book_table.setItem(row, 1, qty_item)
-            
-            # Avg Price
-            self.position_book_table.setItem(row, 2, QTableWidgetItem(pos.get('netavgprc', '0.00')))
-            
-            # LTP
-            self.position_book_table.setItem(row, 3, QTableWidgetItem(pos.get('lp', '0.00')))
+        """Refresh position book data (repeated calls in one pass run once)."""
+        if not self._refresh_pending['position']:
+            self._refresh_pending['position'] = True
+            QTimer.singleShot(0, self._do_refresh_position_book)
             
-            # P&L (Realized)
-            rpnl = float(pos.get('rpnl', '0.00'))
-            pnl_item = QTableWidgetItem(f"{rpnl:.2f}")
-            pnl_item.setForeground(QColor("#4caf50") if rpnl >= 0 else QColor("#f44336"))
-            self.position_book_table.setItem(row, 4, pnl_item)
+    def _do_refresh_position_book(self):
+        """Start the position book worker unless it is already running."""
+        self._refresh_pending['position'] = False
+        if 'position' in self._tasks:
+            return
             
-            # M2M (Unrealized)
-            urmtom = float(pos.get('urmtom', '0.00'))
-            m2m_item = QTableWidgetItem(f"{urmtom:.2f}")
-            m2m_item.setForeground(QColor("#4caf50") if urmtom >= 0 else QColor("#f44336"))
-            self.position_book_table.setItem(row, 5, m2m_item)
-            
-            # Day Stats
-            self.position_book_table.setItem(row, 6, QTableWidgetItem(pos.get('daybuyqty', '0')))
-            self.position_book_table.setItem(row, 7, QTableWidgetItem(pos.get('daysellqty', '0')))
-            
-            # Product Name
-            self.position_book_table.setItem(row, 8, QTableWidgetItem(pos.get('prd', '0')))
-            self.position_book_table.setItem(row, 9, QTableWidgetItem(pos.get('cfsellqty', '0')))
+        worker = PositionBookWorker(self.broker)
+        worker.signals.data_received.connect(self._update_position_book_table)
+        self._start_task('position', worker)
 
-            #Day Amt
-            self.position_book_table.setItem(row, 10, QTableWidgetItem(pos.get('daybuyamt', '0.00')))
-            self.position_book_table.setItem(row, 11, QTableWidgetItem(pos.get('daysellamt', '0.00')))
\ No newline at end of file
+    def _update_position_book_table(self, positions):
+        """Update Position Book table with data."""
+        self.position_book_model.set_rows(positions)
@@ -0,0 +1,81 @@
+"""
+Broker Cache
+Thread-safe memoization of broker reads shared by the worker threads.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+# Historical windows kept in memory (least recently used are dropped)
+HISTORY_CACHE_SIZE = 1024
+
+# Windows ending later than this before now may still contain a forming bar
+FORMING_BAR_AGE = timedelta(minutes=1)
+
+# Quotes are reused for this many seconds
+QUOTE_TTL = 0.5
+QUOTE_CACHE_SIZE = 4096
+
+_history = OrderedDict()  # (broker, symbol, timeframe, start, end) -> tuple of bars
+_history_lock = threading.Lock()
+
+_quotes = {}  # (broker, symbol) -> (expires, Symbol)
+_quotes_lock = threading.Lock()
+
+
+def get_historical_data(broker, symbol, timeframe, start_time, end_time):
+    """
+    broker.get_historical_data() with an LRU cache for closed windows.
+    
+    Bars are immutable once closed, so a window ending more than
+    FORMING_BAR_AGE ago is fetched once. Empty results are not cached.
+    """
+    if end_time is None or end_time > datetime.now() - FORMING_BAR_AGE:
+        return broker.get_historical_data(symbol, timeframe, start_time, end_time)
+        
+    key = (broker, symbol, timeframe, int(start_time.timestamp()), int(end_time.timestamp()))
+    with _history_lock:
+        bars = _history.get(key)
+        if bars is not None:
+            _history.move_to_end(key)
+            return list(bars)
+            
+    data = broker.get_historical_data(symbol, timeframe, start_time, end_time)
+    if data:
+        with _history_lock:
+            _history[key] = tuple(data)
+            if len(_history) > HISTORY_CACHE_SIZE:
+                _history.popitem(last=False)
+    return data
+
+
+def get_symbol_infos(broker, symbols):
+    """
+    broker.get_symbol_infos() reusing quotes fetched within QUOTE_TTL.
+    Only the symbols without a fresh cached quote are requested.
+    """
+    now = time.monotonic()
+    infos = {}
+    missing = []
+    with _quotes_lock:
+        for symbol in symbols:
+            cached = _quotes.get((broker, symbol))
+            if cached is not None and cached[0] > now:
+                infos[symbol] = cached[1]
+            else:
+                missing.append(symbol)
+                
+    if missing:
+        fresh = broker.get_symbol_infos(missing)
+        expires = time.monotonic() + QUOTE_TTL
+        with _quotes_lock:
+            if len(_quotes) + len(fresh) > QUOTE_CACHE_SIZE:
+                for key in [k for k, (exp, _) in _quotes.items() if exp <= now]:
+                    del _quotes[key]
+                if len(_quotes) + len(fresh) > QUOTE_CACHE_SIZE:
+                    _quotes.clear()
+            for symbol, info in fresh.items():
+                _quotes[(broker, symbol)] = (expires, info)
+        infos.update(fresh)
+    return infos
@@ -0,0 +1,50 @@
+"""
+Broker Executor
+Shared, bounded thread pool for one-shot broker calls.
+"""
+from abc import ABCMeta, abstractmethod
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# Maximum number of broker calls running at the same time
+MAX_BROKER_THREADS = 4
+
+broker_pool = QThreadPool()
+broker_pool.setMaxThreadCount(MAX_BROKER_THREADS)
+
+
+# Combined metaclass so the QRunnable base can declare abstract methods
+class _TaskMeta(type(QRunnable), ABCMeta):
+    pass
+
+
+class BrokerTask(QRunnable, metaclass=_TaskMeta):
+    """
+    One-shot broker call executed on the shared broker_pool.
+    
+    QRunnable cannot own signals, so every task carries a ``signals``
+    object created from its nested Signals class. Subclasses extend
+    Signals with their own result signals and implement execute();
+    ``signals.finished`` is emitted after every run, even a failed one.
+    """
+    
+    class Signals(QObject):
+        finished = pyqtSignal()
+        
+    def __init__(self):
+        super().__init__()
+        self.signals = self.Signals()
+        
+    def start(self):
+        """Queue the task on the broker pool."""
+        broker_pool.start(self)
+        
+    def run(self):
+        try:
+            self.execute()
+        finally:
+            self.signals.finished.emit()
+            
+    @abstractmethod
+    def execute(self):
+        """Perform the broker call and emit its result signals."""
+        pass
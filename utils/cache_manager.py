@@ -4,8 +4,23 @@ Handles clearing of application cache and compiled python files.
 """
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from utils.logger import logger
 
+# Worker threads used to delete __pycache__ trees in parallel
+DELETE_WORKERS = 8
+
+
+def _remove_tree(path):
+    """Delete a directory tree; returns True on success."""
+    try:
+        shutil.rmtree(path)
+        return True
+    except Exception as e:
+        logger.error("Failed to delete %s: %s", path, e)
+        return False
+
+
 def clear_cache(root_dir="."):
     """
     Recursively deletes __pycache__ directories and .pyc files.
@@ -17,45 +32,56 @@ def clear_cache(root_dir="."):
     Returns:
         int: Number of files/directories deleted.
     """
-    deleted_count = 0
+    pycache_dirs = []
+    deleted_files = 0
     
-    # 1. Clear __pycache__ and .pyc files
-    for root, dirs, files in os.walk(root_dir):
-        # Remove __pycache__ directories
-        if "__pycache__" in dirs:
-            cache_path = os.path.join(root, "__pycache__")
-            try:
-                shutil.rmtree(cache_path)
-                logger.info(f"Deleted cache directory: {cache_path}")
-                deleted_count += 1
-            except Exception as e:
-                logger.error(f"Failed to delete {cache_path}: {e}")
-        
-        # Remove standalone .pyc files (if any)
-        for file in files:
-            if file.endswith(".pyc") or file.endswith(".pyo"):
-                file_path = os.path.join(root, file)
+    # 1. Clear __pycache__ and .pyc files (iterative scandir walk; DirEntry
+    #    caches the type from the directory listing, so no extra stat calls)
+    stack = [root_dir]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.error("Failed to scan %s: %s", path, e)
+            continue
+            
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "__pycache__":
+                    # Collected now, deleted in parallel after the walk
+                    pycache_dirs.append(entry.path)
+                else:
+                    stack.append(entry.path)
+                    
+            # Remove standalone .pyc files (if any)
+            elif entry.name.endswith((".pyc", ".pyo")):
                 try:
-                    os.remove(file_path)
-                    logger.info(f"Deleted compiled file: {file_path}")
-                    deleted_count += 1
+                    os.remove(entry.path)
+                    deleted_files += 1
                 except Exception as e:
-                    logger.error(f"Failed to delete {file_path}: {e}")
+                    logger.error("Failed to delete %s: %s", entry.path, e)
                     
+    # Remove __pycache__ directories (unlink is I/O bound, so overlap it)
+    deleted_dirs = 0
+    if pycache_dirs:
+        with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as pool:
+            deleted_dirs = sum(pool.map(_remove_tree, pycache_dirs))
+            
+    logger.info("Deleted %s __pycache__ dirs, %s compiled files", deleted_dirs, deleted_files)
+    deleted_count = deleted_dirs + deleted_files
+    
     # 2. Clear application cache directory
     app_cache_dir = os.path.join(root_dir, "cache")
-    if os.path.exists(app_cache_dir):
+    if os.path.isdir(app_cache_dir):
         try:
-            # Delete all contents but keep the directory
-            for item in os.listdir(app_cache_dir):
-                item_path = os.path.join(app_cache_dir, item)
-                if os.path.isfile(item_path):
-                    os.remove(item_path)
-                elif os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-            logger.info(f"Cleared application cache directory: {app_cache_dir}")
+            # Drop the whole tree and recreate the (empty) directory
+            shutil.rmtree(app_cache_dir)
+            os.makedirs(app_cache_dir)
+            logger.info("Cleared application cache directory: %s", app_cache_dir)
             deleted_count += 1
         except Exception as e:
-            logger.error(f"Failed to clear app cache {app_cache_dir}: {e}")
+            logger.error("Failed to clear app cache %s: %s", app_cache_dir, e)
             
     return deleted_count
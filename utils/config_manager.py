@@ -3,12 +3,20 @@ import yaml
 import os
 from typing import Any, Dict
 
+# libyaml bindings are much faster; fall back to the pure Python ones
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 
 class ConfigManager:
     """Manages application configuration from YAML file."""
     
     _instance = None
     _config: Dict[str, Any] = {}
+    _flat: Dict[str, Any] = None  # 'a.b.c' -> value, rebuilt lazily after changes
+    _loaded_stamp = None  # (path, mtime_ns, size) of the file _config matches
     
     def __new__(cls):
         if cls._instance is None:
@@ -16,28 +24,46 @@ class ConfigManager:
         return cls._instance
     
     def load_config(self, config_path: str = "config.yaml"):
-        """Load configuration from YAML file."""
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                self._config = yaml.safe_load(f)
-        else:
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
+        """Load configuration from YAML file (skipped if the file is unchanged)."""
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+            
+        stamp = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+        if stamp == self._loaded_stamp:
+            return
+            
+        with open(config_path, 'r') as f:
+            self._config = yaml.load(f, Loader=SafeLoader)
+        self._flat = None
+        self._loaded_stamp = stamp
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get configuration value using dot notation.
         Example: config.get('broker.server')
         """
-        keys = key_path.split('.')
-        value = self._config
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        
-        return value
+        if self._flat is None:
+            self._flat = self._flatten(self._config)
+        return self._flat.get(key_path, default)
+    
+    @staticmethod
+    def _flatten(config: Any) -> Dict[str, Any]:
+        """Map every dot path (including intermediate sections) to its value."""
+        flat = {}
+        if not isinstance(config, dict):
+            return flat
+            
+        stack = [("", config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+        return flat
     
     def set(self, key_path: str, value: Any):
         """Set configuration value using dot notation."""
@@ -50,11 +76,13 @@ class ConfigManager:
             config = config[key]
         
         config[keys[-1]] = value
+        self._flat = None
+        self._loaded_stamp = None  # No longer matches the file
     
     def save(self, config_path: str = "config.yaml"):
         """Save current configuration to file."""
         with open(config_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False)
+            yaml.dump(self._config, f, Dumper=SafeDumper, default_flow_style=False)
     
     @property
     def all(self) -> Dict[str, Any]:
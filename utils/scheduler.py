@@ -1,35 +1,82 @@
 """Task scheduler for periodic operations."""
+import heapq
+import itertools
+import time
 from PyQt5.QtCore import QTimer, QObject
 
+# Resolution of the shared tick timer
+TICK_MS = 50
+
 
 class Scheduler(QObject):
-    """Schedule and manage periodic tasks."""
+    """
+    Schedule and manage periodic tasks.
+    
+    All tasks share one tick timer; due tasks are kept in a heap of
+    ``(deadline_ms, seq, name, generation, interval_ms, callback)``.
+    Cancelling or rescheduling only bumps the task's generation, and stale
+    heap entries are dropped when they reach the top.
+    """
     
     def __init__(self):
         super().__init__()
-        self._timers = {}
+        self._heap = []
+        self._generations = {}
+        self._seq = itertools.count()
+        self._next_generation = itertools.count(1)
+        
+        self._timer = QTimer(self)
+        self._timer.setInterval(TICK_MS)
+        self._timer.timeout.connect(self._on_tick)
+    
+    @staticmethod
+    def _now_ms() -> int:
+        return int(time.monotonic() * 1000)
     
     def schedule(self, name: str, interval_ms: int, callback):
         """Schedule a recurring task."""
-        if name in self._timers:
-            self._timers[name].stop()
-        
-        timer = QTimer(self)
-        timer.timeout.connect(callback)
-        timer.start(interval_ms)
-        self._timers[name] = timer
+        # A zero interval would stay due forever within one tick
+        interval_ms = max(1, interval_ms)
+        generation = next(self._next_generation)
+        self._generations[name] = generation
+        heapq.heappush(
+            self._heap,
+            (self._now_ms() + interval_ms, next(self._seq), name, generation, interval_ms, callback)
+        )
+        if not self._timer.isActive():
+            self._timer.start()
     
     def cancel(self, name: str):
         """Cancel a scheduled task."""
-        if name in self._timers:
-            self._timers[name].stop()
-            del self._timers[name]
+        # Tombstone: the heap entry is discarded once it comes due
+        self._generations.pop(name, None)
+        if not self._generations:
+            self.cancel_all()
     
     def cancel_all(self):
         """Cancel all scheduled tasks."""
-        for timer in self._timers.values():
-            timer.stop()
-        self._timers.clear()
+        self._timer.stop()
+        self._heap.clear()
+        self._generations.clear()
+        
+    def _on_tick(self):
+        """Run every task whose deadline has passed."""
+        heap = self._heap
+        generations = self._generations
+        now = self._now_ms()
+        
+        while heap and heap[0][0] <= now:
+            deadline, _, name, generation, interval_ms, callback = heapq.heappop(heap)
+            if generations.get(name) != generation:
+                continue
+                
+            # Re-arm before running; missed periods are skipped like QTimer does
+            deadline += interval_ms
+            if deadline <= now:
+                deadline = now + interval_ms
+            heapq.heappush(heap, (deadline, next(self._seq), name, generation, interval_ms, callback))
+            
+            callback()
 
 
 # Global scheduler instance
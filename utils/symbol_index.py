@@ -0,0 +1,135 @@
+"""
+Symbol Index.
+Trigram index over the symbol universe for fast substring autocomplete.
+"""
+import sqlite3
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+# Maximum number of candidates returned per lookup
+MAX_CANDIDATES = 100
+
+
+class SymbolIndex:
+    """
+    Case-insensitive substring lookup over a large symbol list.
+    
+    Every symbol is split into trigrams (``"SBIN"`` -> ``SBI``, ``BIN``);
+    a query intersects the row sets of its own trigrams, so only a handful
+    of rows are checked instead of the whole universe.
+    """
+    
+    def __init__(self, symbols: Iterable[str] = ()):
+        self._symbols: List[str] = []
+        self._upper: List[str] = []
+        self._trigrams: Dict[str, Set[int]] = {}
+        self.set_symbols(symbols)
+        
+    def __len__(self):
+        return len(self._symbols)
+        
+    def set_symbols(self, symbols: Iterable[str]):
+        """Rebuild the index from a new symbol list."""
+        self._symbols = sorted(set(symbols))
+        self._upper = [s.upper() for s in self._symbols]
+        
+        trigrams = defaultdict(set)
+        for row, name in enumerate(self._upper):
+            for i in range(len(name) - 2):
+                trigrams[name[i:i + 3]].add(row)
+        self._trigrams = dict(trigrams)
+        
+    def candidates(self, text: str, limit: int = MAX_CANDIDATES) -> List[str]:
+        """
+        Get up to ``limit`` symbols containing ``text``.
+        
+        Prefix matches are ranked first, then the remaining matches in
+        alphabetical order.
+        """
+        text = text.strip().upper()
+        if not text:
+            return self._symbols[:limit]
+            
+        if len(text) < 3:
+            # Too short for trigrams; scan, but stop as soon as we have enough
+            rows = []
+            for row, name in enumerate(self._upper):
+                if text in name:
+                    rows.append(row)
+                    if len(rows) >= limit:
+                        break
+        else:
+            # Intersect the smallest sets first so the result shrinks quickly
+            sets = sorted(
+                (self._trigrams.get(text[i:i + 3], ()) for i in range(len(text) - 2)),
+                key=len
+            )
+            rows = set(sets[0])
+            for other in sets[1:]:
+                if not rows:
+                    break
+                rows &= other
+                
+            # Trigrams can match out of order; confirm the real substring
+            rows = sorted(row for row in rows if text in self._upper[row])
+            
+        upper = self._upper
+        rows.sort(key=lambda row: (not upper[row].startswith(text), row))
+        return [self._symbols[row] for row in rows[:limit]]
+
+
+class SqliteSymbolIndex:
+    """
+    SymbolIndex backed by an in-memory SQLite FTS5 trigram table.
+    Filtering and ranking run inside SQLite, so lookups stay fast and
+    memory stays flat even for very large symbol universes.
+    """
+    
+    _MATCH_SQL = (
+        "SELECT name FROM syms WHERE name MATCH ? "
+        "ORDER BY instr(upper(name), ?) != 1, name LIMIT ?"
+    )
+    _LIKE_SQL = (
+        "SELECT name FROM syms WHERE name LIKE ? ESCAPE '\\' "
+        "ORDER BY instr(upper(name), ?) != 1, name LIMIT ?"
+    )
+    
+    def __init__(self, symbols: Iterable[str] = ()):
+        self._conn = sqlite3.connect(":memory:")
+        self._conn.execute("CREATE VIRTUAL TABLE syms USING fts5(name, tokenize='trigram')")
+        self._count = 0
+        self.set_symbols(symbols)
+        
+    def __len__(self):
+        return self._count
+        
+    def set_symbols(self, symbols: Iterable[str]):
+        """Rebuild the index from a new symbol list."""
+        names = sorted(set(symbols))
+        with self._conn:
+            self._conn.execute("DELETE FROM syms")
+            self._conn.executemany("INSERT INTO syms(name) VALUES (?)", ((n,) for n in names))
+        self._count = len(names)
+        
+    def candidates(self, text: str, limit: int = MAX_CANDIDATES) -> List[str]:
+        """Get up to ``limit`` symbols containing ``text`` (prefix matches first)."""
+        text = text.strip().upper()
+        if len(text) >= 3:
+            # Quoted phrase: a plain substring match on the trigram index
+            sql, pattern = self._MATCH_SQL, '"' + text.replace('"', '""') + '"'
+        else:
+            escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            sql, pattern = self._LIKE_SQL, f"%{escaped}%"
+        return [row[0] for row in self._conn.execute(sql, (pattern, text, limit))]
+
+
+def create_symbol_index(symbols: Iterable[str] = ()):
+    """
+    Create the best available symbol index.
+    Uses SQLite FTS5 when the trigram tokenizer is available (SQLite 3.34+),
+    otherwise falls back to the pure Python SymbolIndex.
+    """
+    try:
+        return SqliteSymbolIndex(symbols)
+    except sqlite3.Error:
+        return SymbolIndex(symbols)
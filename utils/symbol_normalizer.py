@@ -2,6 +2,7 @@
 Symbol Normalizer.
 Handles conversion between different symbol formats (colon vs pipe).
 """
+import sys
 from typing import Optional, Dict
 from utils.logger import logger
 
@@ -15,6 +16,8 @@ class SymbolNormalizer:
     - NSE:SBIN-EQ <-> NSE|123
     """
     
+    __slots__ = ('_colon_to_pipe', '_pipe_to_colon')
+    
     def __init__(self):
         # Cache for symbol mappings
         self._colon_to_pipe: Dict[str, str] = {}
@@ -28,9 +31,12 @@ class SymbolNormalizer:
             colon_format: Symbol in colon format (e.g., MCX:NATURALGAS26DEC25)
             pipe_format: Symbol in pipe format (e.g., MCX|467741)
         """
+        # Interned keys/values let equal symbols from the feed compare by identity
+        colon_format = sys.intern(colon_format)
+        pipe_format = sys.intern(pipe_format)
         self._colon_to_pipe[colon_format] = pipe_format
         self._pipe_to_colon[pipe_format] = colon_format
-        logger.debug(f"Registered symbol mapping: {colon_format} <-> {pipe_format}")
+        logger.debug("Registered symbol mapping: %s <-> %s", colon_format, pipe_format)
     
     def auto_register_from_symbol(self, symbol_obj):
         """
@@ -88,16 +94,8 @@ class SymbolNormalizer:
         if self._pipe_to_colon.get(symbol1) == symbol2:
             return True
             
-        # Extract exchange and check if base symbols match
-        exchange1, base1 = self._extract_parts(symbol1)
-        exchange2, base2 = self._extract_parts(symbol2)
-        
-        # Same exchange is required
-        if exchange1 != exchange2:
-            return False
-        
-        # For token format (pipe), we can't match easily
-        # Require explicit mapping
+        # Different exchanges never match, and for token format (pipe)
+        # we can't match base symbols easily - require explicit mapping
         return False
     
     def get_all_formats(self, symbol: str) -> list:
@@ -120,25 +118,6 @@ class SymbolNormalizer:
             
         return formats
     
-    def _extract_parts(self, symbol: str) -> tuple:
-        """
-        Extract exchange and base symbol.
-        
-        Args:
-            symbol: Symbol string
-            
-        Returns:
-            Tuple of (exchange, base)
-        """
-        if ':' in symbol:
-            parts = symbol.split(':', 1)
-            return parts[0], parts[1] if len(parts) > 1 else ''
-        elif '|' in symbol:
-            parts = symbol.split('|', 1)
-            return parts[0], parts[1] if len(parts) > 1 else ''
-        else:
-            return '', symbol
-    
     def to_pipe_format(self, symbol: str) -> Optional[str]:
         """
         Convert symbol to pipe format if possible.
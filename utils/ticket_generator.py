@@ -1,24 +1,26 @@
 """Ticket number generator for orders."""
-import threading
+import itertools
 
 
 class TicketGenerator:
-    """Generate unique ticket numbers for orders."""
+    """
+    Generate unique ticket numbers for orders.
+    
+    ``next()`` on an ``itertools.count`` is a single C call, so under the
+    CPython GIL it is atomic and needs no explicit lock.
+    """
     
     _instance = None
-    _lock = threading.Lock()
-    _counter = 100000000
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            cls._instance._counter = itertools.count(100000001)
         return cls._instance
     
     def generate(self) -> int:
         """Generate next ticket number."""
-        with self._lock:
-            self._counter += 1
-            return self._counter
+        return next(self._counter)
 
 
 # Global ticket generator
@@ -1,18 +1,52 @@
 """
 Worker Threads for Non-Blocking Operations
 Prevents UI freeze during broker operations
+
+One-shot workers are BrokerTasks run on the shared broker pool; their
+signals live on ``worker.signals``. Long-lived loops stay QThreads.
 """
-from PyQt5.QtCore import QThread, pyqtSignal
+import queue
+import random
+import threading
+import time
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
+from core.event_bus import event_bus
+from data.models import ohlc_to_array
+from utils import broker_cache
+from utils.broker_executor import BrokerTask
 from utils.logger import logger
 
+__all__ = [
+    'BrokerConnectionWorker', 'QuoteUpdateWorker', 'OrderRequest', 'OrderDispatcher',
+    'HistoricalDataWorker', 'OrderBookWorker', 'TradeTableWorker', 'PositionBookWorker',
+]
+
+# Identical progress messages within this window (seconds) are dropped
+PROGRESS_DEDUP_WINDOW = 0.1
+
+# Streamed ticks wait at most this long after the first buffered one
+STREAM_FLUSH_MS = 50
+
+# Queued orders older than this (seconds) are dropped, not sent
+ORDER_MAX_AGE = 5.0
 
-class BrokerConnectionWorker(QThread):
+# Quote polling retry delay after an error: doubles per failure up to the cap
+RETRY_BACKOFF_MIN = 0.1
+RETRY_BACKOFF_MAX = 30.0
+
+# Quote polling interval adapts between these bounds to how much moved;
+# polling faster than the quote cache TTL would only re-read cached quotes
+POLL_INTERVAL_MIN_MS = max(100, int(broker_cache.QUOTE_TTL * 1000))
+POLL_INTERVAL_MAX_MS = 5000
+
+
+class BrokerConnectionWorker(BrokerTask):
     """Background worker for broker connection."""
     
-    # Signals
-    connection_success = pyqtSignal(str)  # username
-    connection_failed = pyqtSignal(str)   # error message
-    progress_update = pyqtSignal(str)     # status message
+    class Signals(BrokerTask.Signals):
+        connection_success = pyqtSignal(str)  # username
+        connection_failed = pyqtSignal(str)   # error message
+        progress_update = pyqtSignal(str)     # status message
     
     def __init__(self, broker, server, username, password):
         super().__init__()
@@ -20,22 +54,72 @@ class BrokerConnectionWorker(QThread):
         self.server = server
         self.username = username
         self.password = password
+        self._last_progress = None
+        self._last_progress_ts = 0.0
     
-    def run(self):
+    def _report_progress(self, message: str):
+        """Emit progress_update, skipping a repeat of the last message sent just before."""
+        now = time.monotonic()
+        if message != self._last_progress or now - self._last_progress_ts > PROGRESS_DEDUP_WINDOW:
+            self.signals.progress_update.emit(message)
+            self._last_progress = message
+            self._last_progress_ts = now
+    
+    def execute(self):
         """Execute connection in background thread."""
         try:
-            self.progress_update.emit("Connecting to broker...")
+            self._report_progress("Connecting to broker...")
             
             success = self.broker.connect(self.server, self.username, self.password)
             
             if success:
-                self.connection_success.emit(self.username)
+                self.signals.connection_success.emit(self.username)
             else:
-                self.connection_failed.emit("Connection failed")
+                self.signals.connection_failed.emit("Connection failed")
                 
         except Exception as e:
             logger.error(f"Connection worker error: {e}")
-            self.connection_failed.emit(str(e))
+            self.signals.connection_failed.emit(str(e))
+
+
+class _TickBatcher(QObject):
+    """
+    Collects streamed ticks inside a worker thread and emits them together.
+    
+    A batch is emitted once ``max_batch`` symbols are buffered or
+    ``max_delay_ms`` after its first tick, whichever comes first. Only the
+    latest tick per symbol is kept, and nothing runs while no ticks arrive.
+    """
+    
+    def __init__(self, symbols, emit, max_batch=64, max_delay_ms=STREAM_FLUSH_MS):
+        super().__init__()
+        self._symbols = set(symbols)
+        self._emit = emit
+        self._max_batch = max_batch
+        self._pending = {}
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max_delay_ms)
+        self._timer.timeout.connect(self.flush)
+        
+    @pyqtSlot(object)
+    def add(self, symbol):
+        """Queue a tick if it belongs to one of our symbols."""
+        if symbol.name in self._symbols or symbol.display_name in self._symbols:
+            self._pending[symbol.name] = symbol
+            if len(self._pending) >= self._max_batch:
+                self.flush()
+            elif not self._timer.isActive():
+                self._timer.start()
+            
+    def flush(self):
+        """Emit the ticks received since the last flush."""
+        self._timer.stop()
+        if self._pending:
+            quotes = list(self._pending.values())
+            self._pending.clear()
+            self._emit(quotes)
 
 
 class QuoteUpdateWorker(QThread):
@@ -45,86 +129,181 @@ class QuoteUpdateWorker(QThread):
     quotes_updated = pyqtSignal(list)  # List of Symbol objects
     update_failed = pyqtSignal(str)    # Error message
     
-    def __init__(self, broker, symbols):
+    def __init__(self, broker, symbols, poll_batch_size=100, poll_interval_ms=1000, stream=False, stream_batch=64):
         super().__init__()
         self.broker = broker
         self.symbols = symbols
-        self.running = True
+        self.poll_batch_size = poll_batch_size    # Symbols per get_symbol_infos() call
+        self.poll_interval_ms = poll_interval_ms  # Initial wait between full passes
+        self.stream = stream                      # Use pushed ticks instead of polling
+        self.stream_batch = stream_batch          # Streamed quotes per emit, at most
+        self._stop = threading.Event()  # Set by stop(); also interrupts waits
+        self._backoff = RETRY_BACKOFF_MIN
+        self._last = {}  # symbol -> (bid, ask, last) as last emitted
+        self._interval_ms = poll_interval_ms
     
     def run(self):
         """Periodically fetch quotes in background."""
-        while self.running:
+        if self.stream:
+            self._run_streaming()
+            return
+            
+        while not self._stop.is_set():
             try:
+                started = time.perf_counter()
                 quotes = []
-                for symbol in self.symbols:
-                    if not self.running:
+                symbols = list(self.symbols)
+                last_emitted = self._last
+                for start in range(0, len(symbols), self.poll_batch_size):
+                    if self._stop.is_set():
                         break
                     
-                    quote = self.broker.get_symbol_info(symbol)
-                    if quote:
+                    # One broker request per slice instead of one per symbol
+                    batch = symbols[start:start + self.poll_batch_size]
+                    infos = broker_cache.get_symbol_infos(self.broker, batch)
+                    
+                    # Only forward quotes that moved since they were last emitted
+                    moved = [
+                        (symbol, quote) for symbol, quote in zip(batch, map(infos.get, batch))
+                        if quote is not None
+                        and (quote.bid, quote.ask, quote.last) != last_emitted.get(symbol)
+                    ]
+                    for symbol, quote in moved:
+                        last_emitted[symbol] = (quote.bid, quote.ask, quote.last)
                         quotes.append(quote)
                 
                 if quotes:
                     self.quotes_updated.emit(quotes)
+                self._backoff = RETRY_BACKOFF_MIN
                 
-                # Wait 1 second between updates
-                self.msleep(1000)
+                # Poll faster while most symbols move, slower while few do
+                changed_ratio = len(quotes) / len(symbols) if symbols else 0.0
+                if changed_ratio > 0.5:
+                    self._interval_ms = max(POLL_INTERVAL_MIN_MS, self._interval_ms // 2)
+                elif changed_ratio < 0.05:
+                    self._interval_ms = min(POLL_INTERVAL_MAX_MS, int(self._interval_ms * 1.5))
+                    
+                # Wait out the rest of the interval, so the cadence does not
+                # drift with fetch latency (returns early on stop)
+                elapsed = time.perf_counter() - started
+                if self._stop.wait(max(0.0, self._interval_ms / 1000 - elapsed)):
+                    break
                 
             except Exception as e:
                 logger.error(f"Quote update worker error: {e}")
                 self.update_failed.emit(str(e))
-                self.msleep(5000)  # Wait 5s before retry
+                # Exponential backoff with +/-20% jitter before retrying
+                if self._stop.wait(self._backoff * random.uniform(0.8, 1.2)):
+                    break
+                self._backoff = min(self._backoff * 2, RETRY_BACKOFF_MAX)
+    
+    def _run_streaming(self):
+        """
+        Subscribe the symbols and forward their pushed ticks.
+        
+        Ticks arrive through event_bus.tick_received (the broker feeds
+        feed_manager) and are queued into this thread's event loop, so the
+        thread sleeps until something actually changes.
+        """
+        symbols = list(self.symbols)
+        batcher = _TickBatcher(symbols, self.quotes_updated.emit, self.stream_batch)
+        event_bus.tick_received.connect(batcher.add)
+        try:
+            for symbol in symbols:
+                self.broker.subscribe(symbol)
+            if not self._stop.is_set():
+                self.exec_()
+        except Exception as e:
+            logger.error(f"Quote update worker error: {e}")
+            self.update_failed.emit(str(e))
+        finally:
+            event_bus.tick_received.disconnect(batcher.add)
+            for symbol in symbols:
+                try:
+                    self.broker.unsubscribe(symbol)
+                except Exception as e:
+                    logger.error(f"Quote unsubscribe error for {symbol}: {e}")
     
     def stop(self):
         """Stop the worker thread."""
-        self.running = False
+        self._stop.set()
+        self.quit()
 
 
-class OrderPlacementWorker(QThread):
-    """Background worker for placing orders."""
+class OrderRequest:
+    """
+    An order queued on OrderDispatcher.
+    
+    ``kwargs`` are passed to broker.place_order(); ``source`` is free-form
+    context for whoever handles the result. A request still queued after
+    ``max_age`` seconds is dropped instead of being sent late.
+    """
+    
+    def __init__(self, source="", max_age=ORDER_MAX_AGE, **kwargs):
+        self.source = source
+        self.kwargs = kwargs
+        self.deadline = time.monotonic() + max_age if max_age else None
+
+
+class OrderDispatcher(QThread):
+    """
+    Background thread placing orders one at a time, in submission order.
+    Brokers serialize and rate-limit order entry anyway, so a single
+    consumer avoids racing several threads against the same endpoint.
+    broker.place_order() runs on this thread and must be thread-safe.
+    """
     
     # Signals
-    order_placed = pyqtSignal(object)  # Order object
-    order_failed = pyqtSignal(str)     # Error message
+    order_placed = pyqtSignal(object, object)  # OrderRequest, Order object
+    order_failed = pyqtSignal(object, str)     # OrderRequest, error message
     
-    def __init__(self, broker, symbol, order_type, volume, price=None, sl=0, tp=0):
+    def __init__(self, broker):
         super().__init__()
         self.broker = broker
-        self.symbol = symbol
-        self.order_type = order_type
-        self.volume = volume
-        self.price = price
-        self.sl = sl
-        self.tp = tp
-    
+        self._queue = queue.SimpleQueue()
+        
+    def submit(self, request: OrderRequest) -> OrderRequest:
+        """Queue an order request (starts the thread on first use)."""
+        self._queue.put(request)
+        if not self.isRunning():
+            self.start()
+        return request
+        
+    def stop(self):
+        """Stop after the requests already queued."""
+        self._queue.put(None)
+        
     def run(self):
-        """Place order in background thread."""
-        try:
-            order = self.broker.place_order(
-                symbol=self.symbol,
-                order_type=self.order_type,
-                volume=self.volume,
-                price=self.price,
-                sl=self.sl,
-                tp=self.tp
-            )
-            
-            if order:
-                self.order_placed.emit(order)
-            else:
-                self.order_failed.emit("Order placement failed")
+        """Place queued orders until stopped."""
+        while True:
+            request = self._queue.get()
+            if request is None:
+                break
                 
-        except Exception as e:
-            logger.error(f"Order placement worker error: {e}")
-            self.order_failed.emit(str(e))
+            if request.deadline is not None and time.monotonic() > request.deadline:
+                logger.warning(f"Dropping stale order request: {request.kwargs}")
+                self.order_failed.emit(request, "Order request expired before it was sent")
+                continue
+                
+            try:
+                order = self.broker.place_order(**request.kwargs)
+                
+                if order:
+                    self.order_placed.emit(request, order)
+                else:
+                    self.order_failed.emit(request, "Order placement failed")
+                    
+            except Exception as e:
+                logger.error(f"Order dispatcher error: {e}")
+                self.order_failed.emit(request, str(e))
 
 
-class HistoricalDataWorker(QThread):
+class HistoricalDataWorker(BrokerTask):
     """Background worker for fetching historical data."""
     
-    # Signals
-    data_received = pyqtSignal(list)   # List of OHLCData
-    error_occurred = pyqtSignal(str)   # Error message
+    class Signals(BrokerTask.Signals):
+        data_received = pyqtSignal(object)  # OHLC_DTYPE structured array
+        error_occurred = pyqtSignal(str)   # Error message
     
     def __init__(self, broker, symbol, timeframe, start_time, end_time):
         super().__init__()
@@ -134,10 +313,11 @@ class HistoricalDataWorker(QThread):
         self.start_time = start_time
         self.end_time = end_time
     
-    def run(self):
+    def execute(self):
         """Fetch data in background."""
         try:
-            data = self.broker.get_historical_data(
+            data = broker_cache.get_historical_data(
+                self.broker,
                 self.symbol,
                 self.timeframe,
                 self.start_time,
@@ -145,52 +325,91 @@ class HistoricalDataWorker(QThread):
             )
             
             if data:
-                self.data_received.emit(data)
+                # Pack into columns here so the chart gets arrays, not objects
+                self.signals.data_received.emit(ohlc_to_array(data))
             else:
-                self.error_occurred.emit(f"No data received for {self.symbol}")
+                self.signals.error_occurred.emit(f"No data received for {self.symbol}")
                 
         except Exception as e:
             logger.error(f"Historical data worker error: {e}")
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
 
 
-class OrderBookWorker(QThread):
+class OrderBookWorker(BrokerTask):
     """Background worker for fetching order book."""
     
-    # Signals
-    data_received = pyqtSignal(list)   # List of Order objects
-    error_occurred = pyqtSignal(str)   # Error message
+    class Signals(BrokerTask.Signals):
+        data_received = pyqtSignal(list)   # List of (Order, time text) tuples
+        error_occurred = pyqtSignal(str)   # Error message
     
     def __init__(self, broker):
         super().__init__()
         self.broker = broker
     
-    def run(self):
+    def execute(self):
         """Fetch order book in background."""
         try:
             orders = self.broker.get_order_book()
-            self.data_received.emit(orders)
+            # Format times here so the GUI thread only copies strings
+            rows = [
+                (order, order.open_time.strftime("%H:%M:%S") if order.open_time else "")
+                for order in orders
+            ]
+            self.signals.data_received.emit(rows)
         except Exception as e:
             logger.error(f"Order book worker error: {e}")
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
 
 
-class PositionBookWorker(QThread):
+class TradeTableWorker(BrokerTask):
+    """Background worker for fetching open trades with their current profit."""
+    
+    class Signals(BrokerTask.Signals):
+        data_received = pyqtSignal(list)   # List of (Order, profit, time text) tuples
+        error_occurred = pyqtSignal(str)   # Error message
+    
+    def __init__(self, broker):
+        super().__init__()
+        self.broker = broker
+    
+    def execute(self):
+        """Fetch open orders and price them in background."""
+        try:
+            orders = self.broker.get_open_orders()
+            infos = self.broker.get_symbol_infos({order.symbol for order in orders})
+            
+            rows = []
+            for order in orders:
+                symbol_info = infos.get(order.symbol)
+                current_price = symbol_info.bid if symbol_info else order.open_price
+                rows.append((
+                    order,
+                    order.calculate_profit(current_price),
+                    order.open_time.strftime("%Y.%m.%d %H:%M"),
+                ))
+                
+            self.signals.data_received.emit(rows)
+        except Exception as e:
+            logger.error(f"Trade table worker error: {e}")
+            self.signals.error_occurred.emit(str(e))
+
+
+class PositionBookWorker(BrokerTask):
     """Background worker for fetching position book."""
     
-    # Signals
-    data_received = pyqtSignal(list)   # List of position dicts
-    error_occurred = pyqtSignal(str)   # Error message
+    class Signals(BrokerTask.Signals):
+        data_received = pyqtSignal(list)   # List of position dicts
+        error_occurred = pyqtSignal(str)   # Error message
     
     def __init__(self, broker):
         super().__init__()
         self.broker = broker
     
-    def run(self):
+    def execute(self):
         """Fetch position book in background."""
         try:
             positions = self.broker.get_positions()
-            self.data_received.emit(positions)
+            self.signals.data_received.emit(positions)
         except Exception as e:
             logger.error(f"Position book worker error: {e}")
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))